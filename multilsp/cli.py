@@ -3,7 +3,11 @@
 
 import argparse
 import logging
+import os
+import signal
 import sys
+import threading
+from types import FrameType
 from typing import List, Optional
 
 from multilsp.service import MultiLanguageServer
@@ -120,16 +124,25 @@ def main(args: Optional[List[str]] = None) -> int:
             # Start as a server
             service.start()
 
+            stop_event = threading.Event()
+
+            def _request_stop(_signum: int, _frame: Optional[FrameType]) -> None:
+                stop_event.set()
+
+            signal.signal(signal.SIGINT, _request_stop)
+
             try:
                 print(f"Multi-Language LSP Interface server started for workspace: {parsed_args.workspace}")
                 print("Press Ctrl+C to stop the server")
 
                 # Keep the server running until Ctrl+C
-                import time
-                while True:
-                    time.sleep(1)
+                if os.name == "nt":
+                    # Lock waits aren't interrupted by signals on Windows
+                    while not stop_event.wait(1):
+                        pass
+                else:
+                    stop_event.wait()
 
-            except KeyboardInterrupt:
                 print("Stopping server...")
             finally:
                 service.stop()
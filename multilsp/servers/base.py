@@ -1,15 +1,155 @@
 """Base language server manager interface."""
 
 import abc
+import collections
+import concurrent.futures
+import copy
+import functools
 import json
 import logging
 import os
-import queue
+import re
+import stat
+import subprocess
 import threading
-from typing import Any, Callable, Dict, List, TypeAlias
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeAlias,
+    Union,
+)
+
+from multilsp.utils.serialization import iter_json_array, json_dumps, json_loads
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 # LSP message types
 LspRequestCallback: TypeAlias = Callable[[Dict[str, Any]], None]
+ResponseCacheKey: TypeAlias = Tuple[str, str, int, int, int]
+
+# Maximum number of cached position query results
+RESPONSE_CACHE_SIZE = 256
+
+# Window (in seconds) within which identical position queries are coalesced
+DEBOUNCE_WINDOW = 0.020
+
+# Idle time (in seconds) after which a document opened for lint/format is closed
+DOCUMENT_IDLE_CLOSE_DELAY = 0.020
+
+# Number of path -> URI conversions kept, shared by all managers
+PATH_URI_CACHE_SIZE = 4096
+
+# Time (in seconds) after which an unanswered asynchronous request is dropped
+CALLBACK_TTL = 30
+
+# Number of recent server stderr lines kept for error reports
+STDERR_TAIL_LINES = 100
+
+_JSONRPC_VERSION = "2.0"
+
+# TextDocumentSyncKind.Incremental: the server accepts ranged didChange events
+_TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+
+# Line ends as LSP positions count them: "\n", "\r\n" and a bare "\r" only,
+# unlike str.splitlines, which also breaks on form feeds, "\x85", "\u2028"...
+_LSP_LINE_END = re.compile(r"(?<=\r\n)|(?<=\n)|(?<=\r)(?!\n)")
+_BARE_CARRIAGE_RETURN = re.compile(r"\r(?!\n)")
+
+# Maximum number of buffers passed to a single os.writev call
+_IOV_MAX = 1024
+
+# Requested capacity of the pipes to and from the server (Linux only), so a
+# large didOpen doesn't stall the writer until the server drains the default
+# 64 KiB pipe buffer
+_PIPE_BUFFER_SIZE = 1 << 20
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", None)
+
+# Notifications with constant params, serialized once at import time
+_INITIALIZED_NOTIFICATION = json_dumps({"jsonrpc": _JSONRPC_VERSION, "method": "initialized", "params": {}})
+_EXIT_NOTIFICATION = json_dumps({"jsonrpc": _JSONRPC_VERSION, "method": "exit", "params": {}})
+_EMPTY_CONFIGURATION_NOTIFICATION = json_dumps({
+    "jsonrpc": _JSONRPC_VERSION,
+    "method": "workspace/didChangeConfiguration",
+    "params": {"settings": {}}
+})
+
+# window/logMessage message types -> logging levels
+_LOG_MESSAGE_LEVELS = {
+    1: logging.ERROR,
+    2: logging.WARNING,
+    3: logging.INFO,
+    4: logging.DEBUG
+}
+
+# Client capabilities sent with every initialize request
+_CLIENT_CAPABILITIES: Dict[str, Any] = {
+    "textDocument": {
+        "synchronization": {
+            "didSave": True,
+            "willSave": True
+        },
+        "completion": {
+            "completionItem": {
+                "snippetSupport": True
+            }
+        },
+        "signatureHelp": {},
+        "definition": {},
+        "references": {},
+        "documentHighlight": {},
+        "formatting": {},
+        "rangeFormatting": {},
+        "onTypeFormatting": {},
+        "rename": {},
+        "publishDiagnostics": {},
+        "diagnostic": {}
+    },
+    "workspace": {
+        "applyEdit": True,
+        "workspaceEdit": {
+            "documentChanges": True
+        },
+        "didChangeConfiguration": {},
+        "didChangeWatchedFiles": {}
+    }
+}
+
+
+@functools.lru_cache(maxsize=PATH_URI_CACHE_SIZE)
+def _path_to_uri(path: str) -> str:
+    """Convert a file path to a file URI, memoizing os.path.abspath.
+
+    Args:
+        path: File path to convert.
+
+    Returns:
+        File URI.
+    """
+    return "file://" + os.path.abspath(path)
+
+
+def _split_lsp_lines(content: str) -> List[str]:
+    """Split a document into lines the way LSP positions count them.
+
+    Args:
+        content: The document content.
+
+    Returns:
+        The lines, with their line endings, like str.splitlines(True).
+    """
+    lines = _LSP_LINE_END.split(content)
+    if not lines[-1]:
+        lines.pop()
+    return lines
 
 
 class BaseLanguageServerManager(abc.ABC):
@@ -18,6 +158,18 @@ class BaseLanguageServerManager(abc.ABC):
     This class defines the interface that all language server managers must implement.
     """
 
+    # Whether run_linter_batch needs the language server to be running
+    batch_lint_needs_server = True
+
+    # Notification method -> name of the handler method; subclasses can extend
+    _NOTIFICATION_HANDLERS: Dict[str, str] = {
+        "window/logMessage": "_on_log_message",
+    }
+
+    # Decode/dispatch pool shared by every manager in the process
+    _shared_parse_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _shared_parse_pool_lock = threading.Lock()
+
     def __init__(self, workspace_path: str):
         """Initialize the language server manager.
 
@@ -29,14 +181,44 @@ class BaseLanguageServerManager(abc.ABC):
         self.server_process = None
 
         # LSP communication
-        self.request_callbacks: Dict[str, LspRequestCallback] = {}
+        # Request id -> (time sent, callback) for asynchronous requests
+        self.request_callbacks: Dict[str, Tuple[float, LspRequestCallback]] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
         self.next_request_id = 1
-        self.response_queue = queue.Queue()
         self.reader_thread = None
         self.writer_thread = None
-        self.write_queue = queue.Queue()
+        self.stderr_thread = None
+        # Most recent lines the server wrote to stderr
+        self._stderr_tail: collections.deque = collections.deque(maxlen=STDERR_TAIL_LINES)
+        self._write_deque: collections.deque = collections.deque()
+        self._write_cv = threading.Condition()
+        # Message bodies waiting to be decoded and dispatched, in arrival order,
+        # and whether a parse pool task is draining them
+        self._dispatch_deque: collections.deque = collections.deque()
+        self._dispatch_lock = threading.Lock()
+        self._dispatch_scheduled = False
         self.running = False
         self.initialization_options = {}
+        # Capabilities advertised by the server in its initialize response
+        self.server_capabilities: Dict[str, Any] = {}
+
+        # LRU cache of idempotent position queries (definition, references),
+        # and the debounce map; both guarded by _response_cache_lock since
+        # managers are called from thread pools. They hold private copies of
+        # the results, and callers get copies, so a caller's changes to its
+        # result never reach the cache
+        self._response_cache: collections.OrderedDict = collections.OrderedDict()
+        self._debounce_last: Dict[Tuple[str, str, int, int], Tuple[float, Any]] = {}
+        self._response_cache_lock = threading.Lock()
+
+        # Document store: URI -> (st_mtime_ns, st_size, text, version)
+        self._doc_cache: Dict[str, Tuple[int, int, str, int]] = {}
+        # URIs of documents currently open in the language server
+        self._open_docs: Set[str] = set()
+        # Pending idle-close timers, by URI; guarded by _docs_lock with _open_docs
+        self._close_timers: Dict[str, threading.Timer] = {}
+        self._docs_lock = threading.Lock()
 
     @property
     @abc.abstractmethod
@@ -79,6 +261,20 @@ class BaseLanguageServerManager(abc.ABC):
         """
         pass
 
+    def run_linter_batch(self, file_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run linter on several files.
+
+        Managers whose linter can check many files in one run override this;
+        by default each file is linted separately.
+
+        Args:
+            file_paths: Paths to the files to lint.
+
+        Returns:
+            Dictionary mapping each file path to its linting results.
+        """
+        return {file_path: self.run_linter(file_path) for file_path in file_paths}
+
     @abc.abstractmethod
     def run_formatter(self, file_path: str) -> str:
         """Run formatter on the specified file.
@@ -99,6 +295,8 @@ class BaseLanguageServerManager(abc.ABC):
 
         self.running = True
 
+        self._enlarge_pipe_buffers()
+
         # Start reader thread
         self.reader_thread = threading.Thread(
             target=self._lsp_reader,
@@ -115,15 +313,40 @@ class BaseLanguageServerManager(abc.ABC):
         )
         self.writer_thread.start()
 
+        # Drain stderr so a chatty server never blocks on a full pipe
+        if self.server_process.stderr:
+            self.stderr_thread = threading.Thread(
+                target=self._lsp_stderr_reader,
+                daemon=True,
+                name=f"{self.language}-lsp-stderr"
+            )
+            self.stderr_thread.start()
+
         # Initialize the LSP server
         self._initialize_lsp_server()
 
+    def _enlarge_pipe_buffers(self) -> None:
+        """Grow the server's stdin and stdout pipe buffers where supported."""
+        if _F_SETPIPE_SZ is None:
+            return
+
+        for pipe in (self.server_process.stdin, self.server_process.stdout):
+            try:
+                fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, _PIPE_BUFFER_SIZE)
+            except OSError as e:
+                # The size may exceed /proc/sys/fs/pipe-max-size
+                self.logger.debug(f"Could not enlarge LSP pipe buffer: {e}")
+
     def _stop_lsp_communication(self) -> None:
         """Stop LSP communication threads."""
-        self.running = False
+        # Send shutdown request while the writer is still running
+        if self.running:
+            self._send_shutdown_request()
 
-        # Send shutdown request
-        self._send_shutdown_request()
+        # Wake the writer so it can drain pending messages and exit
+        with self._write_cv:
+            self.running = False
+            self._write_cv.notify_all()
 
         if self.reader_thread and self.reader_thread.is_alive():
             self.reader_thread.join(timeout=2)
@@ -131,6 +354,48 @@ class BaseLanguageServerManager(abc.ABC):
         if self.writer_thread and self.writer_thread.is_alive():
             self.writer_thread.join(timeout=2)
 
+        # A restarted server advertises its capabilities again
+        self.server_capabilities = {}
+
+        # A restarted server starts with no open documents
+        with self._docs_lock:
+            for timer in self._close_timers.values():
+                timer.cancel()
+            self._close_timers.clear()
+            self._open_docs.clear()
+
+    @classmethod
+    def _get_parse_pool(cls) -> concurrent.futures.ThreadPoolExecutor:
+        """Get the thread pool that decodes and dispatches LSP messages.
+
+        The pool is created on first use and shared by all language servers, so
+        adding a server doesn't add decoding threads. Each server's messages
+        are drained by at most one task at a time, so they are dispatched in
+        the order they arrived.
+
+        Returns:
+            The shared thread pool.
+        """
+        with cls._shared_parse_pool_lock:
+            if BaseLanguageServerManager._shared_parse_pool is None:
+                BaseLanguageServerManager._shared_parse_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=2,
+                    thread_name_prefix="lsp-parse"
+                )
+            return BaseLanguageServerManager._shared_parse_pool
+
+    def _lsp_stderr_reader(self) -> None:
+        """Drain the LSP server's stderr until the process closes it."""
+        stderr = self.server_process.stderr
+        try:
+            for line in iter(stderr.readline, b""):
+                line = line.decode("utf-8", "replace").rstrip()
+                self._stderr_tail.append(line)
+                self.logger.debug("LSP server stderr: %s", line)
+        except (OSError, ValueError):
+            # The pipe was closed while stopping the server
+            pass
+
     def _lsp_reader(self) -> None:
         """Read responses from the LSP server."""
         if not self.server_process or not self.server_process.stdout:
@@ -139,32 +404,57 @@ class BaseLanguageServerManager(abc.ABC):
 
         while self.running and self.server_process.poll() is None:
             try:
-                # Read the header
-                line = self.server_process.stdout.readline().strip()
-                if not line:
+                # Read header lines until the blank separator line, ignoring
+                # any header fields other than Content-Length
+                content_length = None
+                while True:
+                    line = self.server_process.stdout.readline()
+                    if not line:
+                        # End of stream: the server has exited
+                        return
+                    if line in (b"\r\n", b"\n"):
+                        break
+                    if line[:15].lower() == b"content-length:":
+                        content_length = int(line.split(b":", 1)[1].strip())
+
+                if content_length is None:
+                    self.logger.warning("Received LSP message without Content-Length header")
                     continue
 
-                if line.startswith(b"Content-Length:"):
-                    content_length = int(line.split(b":")[1])
+                # Read the content and hand it off for decoding
+                content = self._read_content(content_length)
+                if content is None:
+                    # End of stream: the server has exited
+                    return
+                self._schedule_dispatch(content)
 
-                    # TODO: this is sketchy. For pylsp, we need to skip 2 empty lines after the header.
-                    # Not sure what is required for other servers.
-                    self.server_process.stdout.readline()
-                    if self.language == "python":
-                        self.server_process.stdout.readline()
+            except Exception as e:
+                self.logger.error(f"Error reading from LSP server: {e}")
+                break
 
-                    # Read the content
-                    content = self.server_process.stdout.read(content_length)
-                    message = json.loads(content.decode("utf-8"))
+    def _read_content(self, content_length: int) -> Optional[bytearray]:
+        """Read exactly content_length bytes of message body from the server.
 
-                    self.logger.debug(f"Received LSP message: {message}")
+        The body is read straight into a buffer of the right size. The buffer
+        isn't reused between messages because it is decoded on another thread.
+        stdout is unbuffered, so a single read may return fewer bytes than
+        requested, and the read loops until the buffer is full.
 
-                    # Process the message
-                    self._process_lsp_message(message)
+        Args:
+            content_length: Size of the message body in bytes.
 
-            except Exception as e:
-                self.logger.error(f"Error reading from LSP server: {e}")
-                break
+        Returns:
+            The message body, or None if the stream ended first.
+        """
+        content = bytearray(content_length)
+        view = memoryview(content)
+        received = 0
+        while received < content_length:
+            count = self.server_process.stdout.readinto(view[received:])
+            if not count:
+                return None
+            received += count
+        return content
 
     def _lsp_writer(self) -> None:
         """Write requests to the LSP server."""
@@ -172,47 +462,159 @@ class BaseLanguageServerManager(abc.ABC):
             self.logger.error("Cannot write to LSP server: server process or stdin is None")
             return
 
-        while self.running and self.server_process.poll() is None:
-            try:
-                # Wait for a message to send
-                message = self.write_queue.get(timeout=0.5)
+        while True:
+            # Wait for messages to send; once stopped, drain what is left
+            with self._write_cv:
+                while self.running and not self._write_deque:
+                    self._write_cv.wait()
+                if not self._write_deque:
+                    break
+                messages = list(self._write_deque)
+                self._write_deque.clear()
 
-                if message:
-                    content = json.dumps(message).encode("utf-8")
-                    header = f"Content-Length: {len(content)}\r\n\r\n".encode()
-
-                    self.logger.debug(f"Sending LSP message: {message}")
+            try:
+                # Frame everything that was queued and write it in one go
+                buffers = []
+                for message in messages:
+                    # Pre-serialized messages are queued as raw bytes
+                    content = message if isinstance(message, bytes) else json_dumps(message)
+                    buffers.append(b"Content-Length: %d\r\n\r\n" % len(content))
+                    buffers.append(content)
 
-                    self.server_process.stdin.write(header + content)
-                    self.server_process.stdin.flush()
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Sending LSP message: %r", message)
 
-                self.write_queue.task_done()
+                self._write_framed(buffers)
 
-            except queue.Empty:
-                # No message to send, continue waiting
-                continue
             except Exception as e:
                 self.logger.error(f"Error writing to LSP server: {e}")
                 break
 
+    def _enqueue_message(self, message: Union[Dict[str, Any], bytes]) -> None:
+        """Queue a message for the writer thread.
+
+        Args:
+            message: The LSP message to send, either as a dictionary or already
+                serialized to JSON bytes.
+        """
+        with self._write_cv:
+            self._write_deque.append(message)
+            self._write_cv.notify()
+
+    def _send_batch(self, messages: List[Union[Dict[str, Any], bytes]]) -> None:
+        """Queue several messages so they reach the server in a single write.
+
+        Each message keeps its own Content-Length frame; LSP servers don't accept
+        JSON-RPC batch arrays.
+
+        Args:
+            messages: The LSP messages to send, in order.
+        """
+        with self._write_cv:
+            self._write_deque.extend(messages)
+            self._write_cv.notify()
+
+    def _write_framed(self, buffers: List[bytes]) -> None:
+        """Write framed LSP messages to the server's stdin.
+
+        Headers and bodies are handed to the kernel as separate buffers of a
+        single writev call, so bodies are never copied into a concatenated bytes
+        object.
+
+        Args:
+            buffers: Alternating encoded LSP headers and message bodies.
+        """
+        stdin = self.server_process.stdin
+        if not hasattr(os, "writev"):
+            # writev is not available on Windows
+            stdin.write(b"".join(buffers))
+            stdin.flush()
+            return
+
+        fd = stdin.fileno()
+        pending: List[Any] = list(buffers)
+        index = 0
+        while index < len(pending):
+            written = os.writev(fd, pending[index:index + _IOV_MAX])
+
+            # Skip fully written buffers and trim a partially written one
+            while index < len(pending) and written >= len(pending[index]):
+                written -= len(pending[index])
+                index += 1
+            if written:
+                pending[index] = memoryview(pending[index])[written:]
+
+    def _schedule_dispatch(self, content: bytearray) -> None:
+        """Queue a raw LSP message body for decoding and dispatch on the parse pool.
+
+        Args:
+            content: The raw message body read from the LSP server.
+        """
+        with self._dispatch_lock:
+            self._dispatch_deque.append(content)
+            if self._dispatch_scheduled:
+                return
+            self._dispatch_scheduled = True
+        self._get_parse_pool().submit(self._drain_dispatch_queue)
+
+    def _drain_dispatch_queue(self) -> None:
+        """Decode and dispatch queued message bodies until the queue is empty."""
+        while True:
+            with self._dispatch_lock:
+                if not self._dispatch_deque:
+                    self._dispatch_scheduled = False
+                    return
+                content = self._dispatch_deque.popleft()
+            self._decode_and_dispatch(content)
+
+    def _decode_and_dispatch(self, content: bytearray) -> None:
+        """Decode a raw LSP message body and process it.
+
+        Errors are logged here, since nothing waits on the parse pool task.
+
+        Args:
+            content: The raw message body read from the LSP server.
+        """
+        try:
+            message = json_loads(content)
+        except ValueError as e:
+            self.logger.error(f"Error decoding LSP message: {e}")
+            return
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Received LSP message: %r", message)
+
+        # Process the message
+        try:
+            self._process_lsp_message(message)
+        except Exception:
+            self.logger.exception("Error processing LSP message")
+
     def _process_lsp_message(self, message: Dict[str, Any]) -> None:
         """Process a message from the LSP server.
 
         Args:
             message: The message from the LSP server.
         """
-        # Check if it's a response to a request
-        if "id" in message and "result" in message:
-            request_id = str(message["id"])
-            if request_id in self.request_callbacks:
-                callback = self.request_callbacks.pop(request_id)
+        method = message.get("method")
+
+        # Messages without a method are responses to our requests
+        if method is None:
+            request_id = str(message.get("id"))
+            with self._pending_lock:
+                slot = self._pending.pop(request_id, None)
+                entry = None if slot else self.request_callbacks.pop(request_id, None)
+
+            if slot is not None:
+                # Wake only the synchronous caller waiting on this id
+                slot["response"] = message
+                slot["event"].set()
+            elif entry is not None:
+                _, callback = entry
                 callback(message)
-            else:
-                # Put the message in the response queue for synchronous requests
-                self.response_queue.put(message)
 
         # Handle notifications (messages without an id)
-        elif "method" in message and "id" not in message:
+        elif "id" not in message:
             self._handle_notification(message)
 
     def _handle_notification(self, notification: Dict[str, Any]) -> None:
@@ -221,22 +623,22 @@ class BaseLanguageServerManager(abc.ABC):
         Args:
             notification: The notification from the LSP server.
         """
-        method = notification.get("method", "")
+        handler_name = self._NOTIFICATION_HANDLERS.get(notification.get("method", ""))
+        if handler_name:
+            getattr(self, handler_name)(notification)
 
-        if method == "window/logMessage":
-            params = notification.get("params", {})
-            message_type = params.get("type", 4)  # Default to log
-            message = params.get("message", "")
+    def _on_log_message(self, notification: Dict[str, Any]) -> None:
+        """Forward a window/logMessage notification to the logger.
 
-            log_levels = {
-                1: logging.ERROR,
-                2: logging.WARNING,
-                3: logging.INFO,
-                4: logging.DEBUG
-            }
+        Args:
+            notification: The notification from the LSP server.
+        """
+        params = notification.get("params", {})
+        message_type = params.get("type", 4)  # Default to log
+        message = params.get("message", "")
 
-            level = log_levels.get(message_type, logging.INFO)
-            self.logger.log(level, f"LSP server: {message}")
+        level = _LOG_MESSAGE_LEVELS.get(message_type, logging.INFO)
+        self.logger.log(level, "LSP server: %s", message)
 
     def _initialize_lsp_server(self) -> None:
         """Initialize the LSP server."""
@@ -245,36 +647,7 @@ class BaseLanguageServerManager(abc.ABC):
             "processId": os.getpid(),
             "rootPath": self.workspace_path,
             "rootUri": f"file://{self.workspace_path}",
-            "capabilities": {
-                "textDocument": {
-                    "synchronization": {
-                        "didSave": True,
-                        "willSave": True
-                    },
-                    "completion": {
-                        "completionItem": {
-                            "snippetSupport": True
-                        }
-                    },
-                    "signatureHelp": {},
-                    "definition": {},
-                    "references": {},
-                    "documentHighlight": {},
-                    "formatting": {},
-                    "rangeFormatting": {},
-                    "onTypeFormatting": {},
-                    "rename": {},
-                    "publishDiagnostics": {}
-                },
-                "workspace": {
-                    "applyEdit": True,
-                    "workspaceEdit": {
-                        "documentChanges": True
-                    },
-                    "didChangeConfiguration": {},
-                    "didChangeWatchedFiles": {}
-                }
-            },
+            "capabilities": _CLIENT_CAPABILITIES,
             "initializationOptions": self.initialization_options,
             "trace": "verbose"
         }
@@ -283,17 +656,19 @@ class BaseLanguageServerManager(abc.ABC):
         response = self._send_request_sync("initialize", params)
 
         if response and "result" in response:
+            self.server_capabilities = (response["result"] or {}).get("capabilities", {})
+
             # Send initialized notification
-            self._send_notification("initialized", {})
+            self._enqueue_message(_INITIALIZED_NOTIFICATION)
 
             # Send workspace/didChangeConfiguration notification
-            self._send_notification("workspace/didChangeConfiguration", {
-                "settings": {}
-            })
+            self._enqueue_message(_EMPTY_CONFIGURATION_NOTIFICATION)
 
             self.logger.info(f"Successfully initialized {self.language} LSP server")
         else:
             self.logger.error(f"Failed to initialize {self.language} LSP server")
+            if self._stderr_tail:
+                self.logger.error("LSP server stderr:\n" + "\n".join(self._stderr_tail))
 
     def _send_shutdown_request(self) -> None:
         """Send shutdown request to the LSP server."""
@@ -302,43 +677,58 @@ class BaseLanguageServerManager(abc.ABC):
 
         if response and "result" in response:
             # Send exit notification
-            self._send_notification("exit", {})
+            self._enqueue_message(_EXIT_NOTIFICATION)
             self.logger.info(f"Successfully shut down {self.language} LSP server")
         else:
             self.logger.error(f"Failed to shut down {self.language} LSP server")
 
-    def _send_request_sync(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _send_request_sync(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        preceding: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """Send a request to the LSP server and wait for the response.
 
         Args:
             method: The LSP method to call.
             params: Parameters for the method.
+            preceding: Notifications to send right before the request, in the
+                same write.
 
         Returns:
             Dictionary containing the response.
         """
-        request_id = str(self.next_request_id)
-        self.next_request_id += 1
+        # Register a slot that the reader fills in when the response arrives;
+        # the id is allocated under the lock so concurrent callers never share one
+        slot: Dict[str, Any] = {"event": threading.Event()}
+        with self._pending_lock:
+            request_id = str(self.next_request_id)
+            self.next_request_id += 1
+            self._pending[request_id] = slot
 
         request = {
-            "jsonrpc": "2.0",
+            "jsonrpc": _JSONRPC_VERSION,
             "id": request_id,
             "method": method,
             "params": params
         }
 
         # Put the request in the write queue
-        self.write_queue.put(request)
+        if preceding:
+            self._send_batch([*preceding, request])
+        else:
+            self._enqueue_message(request)
 
         # Wait for the response
-        try:
-            response = self.response_queue.get(timeout=10)
-            self.response_queue.task_done()
-            return response
-        except queue.Empty:
+        if not slot["event"].wait(timeout=10):
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
             self.logger.error(f"Timeout waiting for response to {method} request")
             return {}
 
+        return slot["response"]
+
     def _send_request_async(self, method: str, params: Dict[str, Any], callback: LspRequestCallback) -> None:
         """Send a request to the LSP server asynchronously.
 
@@ -347,21 +737,80 @@ class BaseLanguageServerManager(abc.ABC):
             params: Parameters for the method.
             callback: Function to call when the response is received.
         """
-        request_id = str(self.next_request_id)
-        self.next_request_id += 1
-
-        # Store the callback
-        self.request_callbacks[request_id] = callback
+        # Store the callback, dropping any that will never be answered; the id
+        # is allocated under the lock so concurrent callers never share one
+        now = time.monotonic()
+        with self._pending_lock:
+            request_id = str(self.next_request_id)
+            self.next_request_id += 1
+            self._sweep_stale_callbacks(now)
+            self.request_callbacks[request_id] = (now, callback)
 
         request = {
-            "jsonrpc": "2.0",
+            "jsonrpc": _JSONRPC_VERSION,
             "id": request_id,
             "method": method,
             "params": params
         }
 
         # Put the request in the write queue
-        self.write_queue.put(request)
+        self._enqueue_message(request)
+
+    def _send_requests_parallel(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Send several requests at once and wait for all of their responses.
+
+        The requests are pipelined, so the total latency is that of the slowest
+        request rather than the sum of all round trips.
+
+        Args:
+            calls: List of (method, params) pairs to send.
+
+        Returns:
+            List of responses in the same order as calls. A request that times
+            out yields an empty dictionary.
+        """
+        results: Dict[int, Dict[str, Any]] = {}
+        events = []
+
+        for index, (method, params) in enumerate(calls):
+            event = threading.Event()
+
+            def callback(message: Dict[str, Any], index: int = index, event: threading.Event = event) -> None:
+                results[index] = message
+                event.set()
+
+            self._send_request_async(method, params, callback)
+            events.append(event)
+
+        # All requests share a single deadline
+        deadline = time.monotonic() + 10
+        for index, event in enumerate(events):
+            if not event.wait(timeout=max(0.0, deadline - time.monotonic())):
+                self.logger.error(f"Timeout waiting for response to {calls[index][0]} request")
+
+        return [results.get(index, {}) for index in range(len(calls))]
+
+    def _sweep_stale_callbacks(self, now: float) -> None:
+        """Drop asynchronous request callbacks that have waited too long.
+
+        A server that crashes or ignores a request never answers it, so without
+        this sweep the callback would stay registered forever. Must be called
+        with _pending_lock held.
+
+        Args:
+            now: The current time.monotonic() value.
+        """
+        stale = [
+            request_id for request_id, (sent_at, _) in self.request_callbacks.items()
+            if now - sent_at > CALLBACK_TTL
+        ]
+        for request_id in stale:
+            del self.request_callbacks[request_id]
+
+        if stale:
+            self.logger.warning(f"Dropped {len(stale)} unanswered {self.language} LSP request(s)")
 
     def _send_notification(self, method: str, params: Dict[str, Any]) -> None:
         """Send a notification to the LSP server.
@@ -371,13 +820,418 @@ class BaseLanguageServerManager(abc.ABC):
             params: Parameters for the method.
         """
         notification = {
-            "jsonrpc": "2.0",
+            "jsonrpc": _JSONRPC_VERSION,
             "method": method,
             "params": params
         }
 
         # Put the notification in the write queue
-        self.write_queue.put(notification)
+        self._enqueue_message(notification)
+
+    def _send_notification_raw(self, method: str, params: bytes) -> None:
+        """Send a notification whose params are already serialized.
+
+        Args:
+            method: The LSP method to call.
+            params: JSON-encoded parameters for the method.
+        """
+        notification = b"".join((
+            b'{"jsonrpc":"', _JSONRPC_VERSION.encode(), b'","method":', json_dumps(method),
+            b',"params":', params, b"}"
+        ))
+
+        # Put the notification in the write queue
+        self._enqueue_message(notification)
+
+    def _stat_regular_file(self, file_path: str) -> os.stat_result:
+        """Stat a file, making sure it is a regular file.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The stat result, which can be passed on to _sync_document.
+
+        Raises:
+            ValueError: If the path doesn't exist or isn't a regular file.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+
+        if st is None or not stat.S_ISREG(st.st_mode):
+            raise ValueError(f"File not found: {file_path}")
+        return st
+
+    def _read_document(self, file_path: str) -> str:
+        """Read a file's content as sent to the language server.
+
+        The file is read unbuffered in one call, into a buffer sized from its
+        stat, and decoded once, instead of going through the incremental
+        decoding and newline translation of a text-mode file. The server thus
+        sees the exact file content that its positions refer to.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The decoded content of the file.
+        """
+        with open(file_path, "rb", buffering=0) as f:
+            return f.read().decode("utf-8")
+
+    def _sync_document(
+        self, file_path: str, language_id: str, st: Optional[os.stat_result] = None
+    ) -> str:
+        """Make sure the language server has the current content of a file.
+
+        The file is only re-read when its mtime or size changed since the last
+        call. An unchanged document that is already open is not sent again; a
+        changed one is sent as a full-text didChange with a bumped version.
+
+        Args:
+            file_path: Path to the file.
+            language_id: LSP language identifier of the document.
+            st: Stat result of the file, if the caller already has one.
+
+        Returns:
+            The current content of the file.
+        """
+        content, message = self._document_sync_message(file_path, language_id, st)
+        if message:
+            self._enqueue_message(message)
+        return content
+
+    def _document_sync_message(
+        self, file_path: str, language_id: str, st: Optional[os.stat_result] = None
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Build the notification that brings the server's copy of a file up to date.
+
+        Same as _sync_document, but the notification is returned instead of
+        sent, so callers can batch it with a request. The document is recorded
+        as open, so the notification must be sent.
+
+        Args:
+            file_path: Path to the file.
+            language_id: LSP language identifier of the document.
+            st: Stat result of the file, if the caller already has one.
+
+        Returns:
+            Tuple of the current content of the file and the didOpen/didChange
+            notification, or None if the server is already up to date.
+        """
+        if st is None:
+            st = os.stat(file_path)
+        uri = self._path_to_uri(file_path)
+        with self._docs_lock:
+            # Keep the document open for this operation
+            timer = self._close_timers.pop(uri, None)
+            if timer:
+                timer.cancel()
+            return self._build_document_sync_message(file_path, uri, st, language_id)
+
+    def _build_document_sync_message(
+        self, file_path: str, uri: str, st: os.stat_result, language_id: str
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Build the sync notification for _document_sync_message.
+
+        Must be called with _docs_lock held.
+
+        Args:
+            file_path: Path to the file.
+            uri: URI of the file.
+            st: Current stat result of the file.
+            language_id: LSP language identifier of the document.
+
+        Returns:
+            Same as _document_sync_message.
+        """
+        cached = self._doc_cache.get(uri)
+
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _, _, content, version = cached
+            if uri in self._open_docs:
+                return content, None
+        else:
+            content = self._read_document(file_path)
+            version = cached[3] + 1 if cached else 1
+            self._doc_cache[uri] = (st.st_mtime_ns, st.st_size, content, version)
+
+            if uri in self._open_docs:
+                # The server holds the cached content; send only the changed
+                # lines if it accepts ranged changes
+                if self._supports_incremental_sync():
+                    change = self._incremental_content_change(cached[2], content)
+                else:
+                    change = {"text": content}
+                return content, {
+                    "jsonrpc": _JSONRPC_VERSION,
+                    "method": "textDocument/didChange",
+                    "params": {
+                        "textDocument": {
+                            "uri": uri,
+                            "version": version
+                        },
+                        "contentChanges": [change]
+                    }
+                }
+
+        self._open_docs.add(uri)
+        return content, {
+            "jsonrpc": _JSONRPC_VERSION,
+            "method": "textDocument/didOpen",
+            "params": {
+                "textDocument": {
+                    "uri": uri,
+                    "languageId": language_id,
+                    "version": version,
+                    "text": content
+                }
+            }
+        }
+
+    def _supports_incremental_sync(self) -> bool:
+        """Check whether the server accepts ranged didChange events.
+
+        Returns:
+            True if the server advertised incremental text document sync.
+        """
+        sync = self.server_capabilities.get("textDocumentSync")
+        if isinstance(sync, dict):
+            sync = sync.get("change")
+        return sync == _TEXT_DOCUMENT_SYNC_INCREMENTAL
+
+    def _incremental_content_change(self, old: str, new: str) -> Dict[str, Any]:
+        """Build a ranged content change turning one document version into another.
+
+        The range covers the whole lines between the common prefix and the
+        common suffix of both versions, which are found with binary searches
+        over slice comparisons rather than a full diff.
+
+        Args:
+            old: The content the server currently holds.
+            new: The new content.
+
+        Returns:
+            A TextDocumentContentChangeEvent with a range, or a full-text one if
+            a version uses bare carriage returns as line breaks.
+        """
+        # Without bare carriage returns, "\n" ends exactly the lines that
+        # _LSP_LINE_END does, so lines can be counted with str.count
+        for text in (old, new):
+            if "\r" in text and _BARE_CARRIAGE_RETURN.search(text):
+                return {"text": new}
+
+        limit = min(len(old), len(new))
+
+        # Length of the common prefix
+        low, high = 0, limit
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[:mid] == new[:mid]:
+                low = mid
+            else:
+                high = mid - 1
+        prefix = low
+
+        # Length of the common suffix, not overlapping the prefix
+        low, high = 0, limit - prefix
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[len(old) - mid:] == new[len(new) - mid:]:
+                low = mid
+            else:
+                high = mid - 1
+        suffix = low
+
+        # Widen the changed span to whole lines, so positions don't depend on
+        # UTF-16 column arithmetic
+        start = old.rfind("\n", 0, prefix) + 1
+        old_end = len(old) - suffix
+        if old_end > start and old[old_end - 1] != "\n":
+            newline = old.find("\n", old_end)
+            old_end = len(old) if newline == -1 else newline + 1
+        new_end = old_end - len(old) + len(new)
+
+        start_line = old.count("\n", 0, start)
+        end_line = start_line + old.count("\n", start, old_end)
+        if old_end == len(old) and old_end > start and old[-1] != "\n":
+            # The range ends inside the unterminated last line
+            last_line = old[old.rfind("\n") + 1:]
+            end_character = len(last_line) if last_line.isascii() else len(last_line.encode("utf-16-le")) // 2
+        else:
+            end_character = 0
+
+        return {
+            "range": {
+                "start": {"line": start_line, "character": 0},
+                "end": {"line": end_line, "character": end_character}
+            },
+            "text": new[start:new_end]
+        }
+
+    def _close_document(self, file_path: str) -> None:
+        """Close a document previously opened with _sync_document.
+
+        Args:
+            file_path: Path to the file.
+        """
+        uri = self._path_to_uri(file_path)
+        with self._docs_lock:
+            timer = self._close_timers.pop(uri, None)
+            if timer:
+                timer.cancel()
+            self._send_did_close(uri)
+
+    def _close_document_when_idle(self, file_path: str) -> None:
+        """Close a document once no operation has used it for a short while.
+
+        Back-to-back operations on the same file, such as lint then format,
+        share one open session instead of each reopening the document and
+        making the server reparse it.
+
+        Args:
+            file_path: Path to the file.
+        """
+        uri = self._path_to_uri(file_path)
+        with self._docs_lock:
+            timer = self._close_timers.pop(uri, None)
+            if timer:
+                timer.cancel()
+
+            timer = threading.Timer(DOCUMENT_IDLE_CLOSE_DELAY, self._close_idle_document, (uri,))
+            timer.daemon = True
+            self._close_timers[uri] = timer
+            timer.start()
+
+    def _close_idle_document(self, uri: str) -> None:
+        """Timer callback that closes a document left idle.
+
+        Args:
+            uri: URI of the document.
+        """
+        with self._docs_lock:
+            # The document was reused or closed since this timer was scheduled
+            if self._close_timers.get(uri) is not threading.current_thread():
+                return
+            del self._close_timers[uri]
+            self._send_did_close(uri)
+
+    def _send_did_close(self, uri: str) -> None:
+        """Send didClose for an open document. Must be called with _docs_lock held.
+
+        Args:
+            uri: URI of the document.
+        """
+        if uri not in self._open_docs:
+            return
+
+        self._send_notification("textDocument/didClose", {
+            "textDocument": {
+                "uri": uri
+            }
+        })
+        self._open_docs.discard(uri)
+
+    def _pull_diagnostics(
+        self, file_path: str, language_id: str, st: Optional[os.stat_result] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Request a file's diagnostics from the server (LSP 3.17 pull model).
+
+        The document sync notification is sent in the same write as the
+        textDocument/diagnostic request, and the document is left open for a
+        follow-up operation.
+
+        Args:
+            file_path: Path to the file.
+            language_id: LSP language identifier of the document.
+            st: Stat result of the file, if the caller already has one.
+
+        Returns:
+            The list of LSP diagnostics, or None if the server doesn't support
+            pull diagnostics or the request failed.
+        """
+        if self.server_capabilities.get("diagnosticProvider") in (None, False):
+            return None
+
+        _, sync_message = self._document_sync_message(file_path, language_id, st)
+        try:
+            response = self._send_request_sync("textDocument/diagnostic", {
+                "textDocument": {
+                    "uri": self._path_to_uri(file_path)
+                }
+            }, preceding=[sync_message] if sync_message else None)
+        except Exception as e:
+            self.logger.error(f"Error requesting diagnostics: {e}")
+            return None
+        finally:
+            self._close_document_when_idle(file_path)
+
+        if not response or not isinstance(response.get("result"), dict):
+            return None
+        return response["result"].get("items", [])
+
+    def _language_id(self, file_path: str) -> str:
+        """Get the LSP language identifier of a file.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The language identifier; the managed language by default.
+        """
+        return self.language
+
+    def _apply_text_edits(self, content: str, edits: List[Dict[str, Any]]) -> str:
+        """Apply LSP TextEdits to a document.
+
+        Line start offsets are computed once for the original content, so each
+        edit position is resolved with a lookup instead of re-splitting the
+        document, and the result is joined once instead of re-slicing the whole
+        document for every edit.
+
+        Args:
+            content: The original document content.
+            edits: The TextEdits returned by the language server.
+
+        Returns:
+            The content with all edits applied.
+        """
+        lines = _split_lsp_lines(content)  # Keep line endings
+
+        # line_starts[i] is the offset of line i; the extra entry is the end
+        line_starts = [0]
+        for line_text in lines:
+            line_starts.append(line_starts[-1] + len(line_text))
+
+        def to_offset(position: Dict[str, int]) -> int:
+            line = position["line"]
+            if line >= len(lines):
+                return len(content)
+
+            # LSP characters count UTF-16 code units
+            character = position["character"]
+            line_text = lines[line]
+            if not line_text.isascii():
+                character = len(line_text.encode("utf-16-le")[:2 * character].decode("utf-16-le", "ignore"))
+            return line_starts[line] + character
+
+        # Build the result in one pass over the edits in document order, copying
+        # the untouched spans in between; edits at the same position keep their
+        # order in the array
+        parts = []
+        cursor = 0
+        for start, _, end, new_text in sorted(
+            (to_offset(edit["range"]["start"]), index, to_offset(edit["range"]["end"]), edit["newText"])
+            for index, edit in enumerate(edits)
+        ):
+            parts.append(content[cursor:start])
+            parts.append(new_text)
+            cursor = end
+        parts.append(content[cursor:])
+
+        return "".join(parts)
 
     def _uri_to_path(self, uri: str) -> str:
         """Convert a file URI to a file path.
@@ -388,9 +1242,7 @@ class BaseLanguageServerManager(abc.ABC):
         Returns:
             File path.
         """
-        if uri.startswith("file://"):
-            return uri[7:]
-        return uri
+        return uri[7:] if uri[:7] == "file://" else uri
 
     def _path_to_uri(self, path: str) -> str:
         """Convert a file path to a file URI.
@@ -401,7 +1253,98 @@ class BaseLanguageServerManager(abc.ABC):
         Returns:
             File URI.
         """
-        return f"file://{os.path.abspath(path)}"
+        return _path_to_uri(path)
+
+    def _get_debounced_response(self, key: Tuple[str, str, int, int]) -> Any:
+        """Return the result of an identical query answered moments ago.
+
+        Args:
+            key: (method, file_path, line, character) of the query.
+
+        Returns:
+            The recent result, or None if there is none within the window.
+        """
+        with self._response_cache_lock:
+            last = self._debounce_last.get(key)
+        if last is not None and time.monotonic() - last[0] < DEBOUNCE_WINDOW:
+            return copy.deepcopy(last[1])
+        return None
+
+    def _store_debounced_response(self, key: Tuple[str, str, int, int], result: Any) -> None:
+        """Remember a query result for the debounce window.
+
+        Args:
+            key: (method, file_path, line, character) of the query.
+            result: The result to remember.
+        """
+        result = copy.deepcopy(result)
+        now = time.monotonic()
+        with self._response_cache_lock:
+            self._debounce_last[key] = (now, result)
+
+            # Drop expired entries so the map doesn't grow without bound
+            if len(self._debounce_last) > RESPONSE_CACHE_SIZE:
+                self._debounce_last = {
+                    k: v for k, v in self._debounce_last.items()
+                    if now - v[0] < DEBOUNCE_WINDOW
+                }
+
+    def _response_cache_key(
+        self, method: str, file_path: str, line: int, character: int
+    ) -> Optional[ResponseCacheKey]:
+        """Build the response cache key for a position query.
+
+        The file's modification time is part of the key, so edits to the file
+        naturally invalidate earlier results.
+
+        Args:
+            method: The LSP method being queried.
+            file_path: Path to the file.
+            line: Line number (0-indexed).
+            character: Character position (0-indexed).
+
+        Returns:
+            The cache key, or None if the file cannot be stat'ed.
+        """
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+        return (method, file_path, mtime_ns, line, character)
+
+    def _get_cached_response(self, key: Optional[ResponseCacheKey]) -> Any:
+        """Look up a cached position query result.
+
+        Args:
+            key: The cache key, as returned by _response_cache_key.
+
+        Returns:
+            The cached result, or None on a cache miss.
+        """
+        if key is None:
+            return None
+        with self._response_cache_lock:
+            result = self._response_cache.get(key)
+            if result is None:
+                return None
+            self._response_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _store_cached_response(self, key: Optional[ResponseCacheKey], result: Any) -> None:
+        """Store a position query result, evicting the oldest entry if full.
+
+        Args:
+            key: The cache key, as returned by _response_cache_key.
+            result: The result to cache.
+        """
+        if key is None:
+            return
+        result = copy.deepcopy(result)
+        with self._response_cache_lock:
+            self._response_cache[key] = result
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
     def get_definition(self, file_path: str, line: int, character: int) -> Dict[str, Any]:
         """Get definition for the symbol at the specified position.
@@ -414,7 +1357,20 @@ class BaseLanguageServerManager(abc.ABC):
         Returns:
             Dictionary containing definition information.
         """
-        self.logger.info(f"Getting definition in file: {file_path} at position {line}:{character}")
+        self.logger.info("Getting definition in file: %s at position %d:%d", file_path, line, character)
+
+        # Coalesce identical queries arriving back-to-back
+        debounce_key = ("textDocument/definition", file_path, line, character)
+        recent = self._get_debounced_response(debounce_key)
+        if recent is not None:
+            return recent
+
+        # Serve repeated queries for an unchanged file from the cache
+        cache_key = self._response_cache_key("textDocument/definition", file_path, line, character)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            self._store_debounced_response(debounce_key, cached)
+            return cached
 
         # Ensure the language server is running
         if not self.is_running():
@@ -438,31 +1394,28 @@ class BaseLanguageServerManager(abc.ABC):
         result = response.get("result", None)
 
         # Handle different response formats (single location or array of locations)
+        if isinstance(result, dict):
+            # Single location
+            result = [result]
+
         if isinstance(result, list):
-            # Array of locations
+            uri_to_path = self._uri_to_path
+            locations = [
+                {"path": uri_to_path(location.get("uri", "")), "range": location.get("range", {})}
+                for location in result
+            ]
+        else:
+            # No definition found
             locations = []
-            for location in result:
-                uri = location.get("uri", "")
-                range_data = location.get("range", {})
-                locations.append({
-                    "path": self._uri_to_path(uri),
-                    "range": range_data
-                })
-            return {"locations": locations}
 
-        if isinstance(result, dict):
-            # Single location
-            uri = result.get("uri", "")
-            range_data = result.get("range", {})
-            return {
-                "locations": [{
-                    "path": self._uri_to_path(uri),
-                    "range": range_data
-                }]
-            }
+        definition = {"locations": locations}
+
+        # Don't cache failed or timed out requests
+        if "result" in response:
+            self._store_cached_response(cache_key, definition)
+            self._store_debounced_response(debounce_key, definition)
 
-        # No definition found
-        return {"locations": []}
+        return definition
 
     def get_references(self, file_path: str, line: int, character: int) -> List[Dict[str, Any]]:
         """Get references for the symbol at the specified position.
@@ -475,7 +1428,20 @@ class BaseLanguageServerManager(abc.ABC):
         Returns:
             List of dictionaries containing reference information.
         """
-        self.logger.info(f"Getting references in file: {file_path} at position {line}:{character}")
+        self.logger.info("Getting references in file: %s at position %d:%d", file_path, line, character)
+
+        # Coalesce identical queries arriving back-to-back
+        debounce_key = ("textDocument/references", file_path, line, character)
+        recent = self._get_debounced_response(debounce_key)
+        if recent is not None:
+            return recent
+
+        # Serve repeated queries for an unchanged file from the cache
+        cache_key = self._response_cache_key("textDocument/references", file_path, line, character)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            self._store_debounced_response(debounce_key, cached)
+            return cached
 
         # Ensure the language server is running
         if not self.is_running():
@@ -499,16 +1465,220 @@ class BaseLanguageServerManager(abc.ABC):
         response = self._send_request_sync("textDocument/references", params)
 
         # Process the response
-        result = response.get("result", [])
+        result = response.get("result") or []
 
         # Convert to a more convenient format
-        references = []
-        for reference in result:
-            uri = reference.get("uri", "")
-            range_data = reference.get("range", {})
-            references.append({
-                "path": self._uri_to_path(uri),
-                "range": range_data
-            })
+        uri_to_path = self._uri_to_path
+        references = [
+            {"path": uri_to_path(reference.get("uri", "")), "range": reference.get("range", {})}
+            for reference in result
+        ]
+
+        # Don't cache failed or timed out requests
+        if "result" in response:
+            self._store_cached_response(cache_key, references)
+            self._store_debounced_response(debounce_key, references)
 
         return references
+
+
+class DirectToolsMixin(abc.ABC):
+    """Linting and formatting through the LSP server with direct tool fallbacks.
+
+    For language server managers whose direct linter and formatter are
+    commands: they implement the command hooks and delegate run_linter and
+    run_formatter to _run_lsp_lint and _run_lsp_format. Must come before
+    BaseLanguageServerManager in the bases.
+    """
+
+    # Names of the direct tools, for logs
+    _LINTER_NAME = "linter"
+    _FORMATTER_NAME = "formatter"
+
+    # FormattingOptions sent with textDocument/formatting
+    _FORMATTING_OPTIONS: Dict[str, Any] = {
+        "tabSize": 2,
+        "insertSpaces": True
+    }
+
+    @abc.abstractmethod
+    def _fallback_lint_cmd(self, file_path: str) -> List[str]:
+        """Get the command that lints a file without the LSP server.
+
+        The command must print the issues as a JSON array.
+
+        Args:
+            file_path: Path to the file to lint.
+
+        Returns:
+            The command line.
+        """
+        pass
+
+    @abc.abstractmethod
+    def _fallback_format_cmd(self, file_path: str) -> List[str]:
+        """Get the command that formats a file without the LSP server.
+
+        The command gets the file content on stdin and must print the
+        formatted content.
+
+        Args:
+            file_path: Path to the file to format.
+
+        Returns:
+            The command line.
+        """
+        pass
+
+    def _run_lsp_lint(self, file_path: str) -> Dict[str, Any]:
+        """Lint a file with LSP pull diagnostics, or with the direct linter.
+
+        Args:
+            file_path: Path to the file to lint.
+
+        Returns:
+            Dictionary containing linting results.
+        """
+        # A single stat both validates the path and feeds the document cache
+        st = self._stat_regular_file(file_path)
+
+        self.logger.info("Running linter on file: %s", file_path)
+
+        # Ensure the server is running
+        if not self.is_running():
+            self.start()
+
+        language_id = self._language_id(file_path)
+
+        # Approach 1: Pull LSP diagnostics, if the server supports it
+        issues = self._pull_diagnostics(file_path, language_id, st)
+        if issues is not None:
+            return {
+                "issues": issues,
+                "success": True
+            }
+
+        # Otherwise open the document, or bring the already open one up to
+        # date, and fall back to the direct linter
+        self._sync_document(file_path, language_id, st)
+
+        # Approach 2: Run the linter directly
+        try:
+            # Parse the JSON report as it is read; only a report under
+            # JSON_BUFFER_LIMIT is buffered in full, for a single orjson call
+            with subprocess.Popen(
+                self._fallback_lint_cmd(file_path),
+                cwd=self.workspace_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as process:
+                try:
+                    results = list(iter_json_array(process.stdout))
+
+                    return {
+                        "issues": results,
+                        "success": True
+                    }
+                except json.JSONDecodeError as e:
+                    # Don't wait for the rest of an output we can't parse
+                    process.kill()
+                    self.logger.error(f"Error parsing {self._LINTER_NAME} output: {e}")
+                    return {
+                        "issues": [],
+                        "success": False,
+                        "error": f"Error parsing linter output: {str(e)}",
+                        "raw_output": e.doc
+                    }
+
+        except Exception as e:
+            self.logger.error(f"Error running {self._LINTER_NAME}: {e}")
+            return {
+                "issues": [],
+                "success": False,
+                "error": str(e)
+            }
+        finally:
+            # Let a follow-up format reuse the open document
+            self._close_document_when_idle(file_path)
+
+    def _run_lsp_format(self, file_path: str) -> str:
+        """Format a file with LSP formatting, or with the direct formatter.
+
+        The direct formatter only runs when the server doesn't support
+        formatting, the request fails or the server returns a null result; an
+        empty edit list means the file is already formatted.
+
+        Args:
+            file_path: Path to the file to format.
+
+        Returns:
+            Formatted content of the file.
+        """
+        # A single stat both validates the path and feeds the document cache
+        st = self._stat_regular_file(file_path)
+
+        self.logger.info("Formatting file: %s", file_path)
+
+        # Ensure the server is running
+        if not self.is_running():
+            self.start()
+
+        # Approach 1: Use LSP formatting, unless the server doesn't support it
+        if self.server_capabilities.get("documentFormattingProvider") not in (None, False):
+            # The document is opened in the LSP server in the same write as the
+            # formatting request (this also reads the file content)
+            content, sync_message = self._document_sync_message(file_path, self._language_id(file_path), st)
+
+            # Request formatting
+            try:
+                response = self._send_request_sync("textDocument/formatting", {
+                    "textDocument": {
+                        "uri": self._path_to_uri(file_path)
+                    },
+                    "options": self._FORMATTING_OPTIONS
+                }, preceding=[sync_message] if sync_message else None)
+
+                # A null result means the server has no formatter for this
+                # file, unlike an empty edit list, which means there is
+                # nothing to change
+                result = response.get("result") if response else None
+                if result is not None:
+                    if result:
+                        # Apply text edits
+                        return self._apply_text_edits(content, result)
+                    return content
+
+                # If we get here, the request failed, timed out or wasn't handled
+                self.logger.info("LSP formatting failed, falling back to direct %s", self._FORMATTER_NAME)
+
+            except Exception as e:
+                self.logger.error(f"Error during LSP formatting: {e}, falling back to direct {self._FORMATTER_NAME}")
+            finally:
+                # Let a follow-up lint reuse the open document
+                self._close_document_when_idle(file_path)
+        else:
+            # Read the file content for the direct formatter
+            content = self._read_document(file_path)
+
+        # Approach 2: Run the formatter directly
+        try:
+            process = subprocess.run(
+                self._fallback_format_cmd(file_path),
+                cwd=self.workspace_path,
+                input=content,
+                capture_output=True,
+                text=True,
+                check=False  # Don't raise exception on non-zero exit code
+            )
+
+            if process.returncode == 0:
+                return process.stdout
+
+            self.logger.error(f"{self._FORMATTER_NAME} error: {process.stderr}")
+            # Return original content if formatting fails
+            return content
+
+        except Exception as e:
+            self.logger.error(f"Error running {self._FORMATTER_NAME}: {e}")
+            # Return original content if formatting fails
+            return content
@@ -1,16 +1,22 @@
 """Java language server manager implementation."""
 
-import json
-import os
 import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from multilsp.servers.base import BaseLanguageServerManager
+from multilsp.servers.base import BaseLanguageServerManager, DirectToolsMixin
+from multilsp.utils.serialization import json_dumps
 
+# JVM flags for the short-lived formatter and linter processes: C1-only JIT,
+# class data sharing and the serial GC trade peak throughput for startup time
+SHORT_LIVED_JVM_FLAGS = ["-XX:TieredStopAtLevel=1", "-Xshare:auto", "-XX:+UseSerialGC"]
 
-class JavaLanguageServerManager(BaseLanguageServerManager):
+
+class JavaLanguageServerManager(DirectToolsMixin, BaseLanguageServerManager):
     """Manages the Java language server."""
 
+    _LINTER_NAME = "checkstyle"
+    _FORMATTER_NAME = "Java formatter"
+
     @property
     def language(self) -> str:
         """Get the language managed by this server.
@@ -46,9 +52,9 @@ class JavaLanguageServerManager(BaseLanguageServerManager):
         # Eclipse JDT Language Server
         self.server_command = ["java", "-jar", "/path/to/eclipse.jdt.ls.jar", "--stdio"]
         # Use Google Java Format for formatting
-        self.formatter_cmd = ["java", "-jar", "/path/to/google-java-format.jar"]
+        self.formatter_cmd = ["java", *SHORT_LIVED_JVM_FLAGS, "-jar", "/path/to/google-java-format.jar"]
         # CheckStyle for linting
-        self.linter_cmd = ["java", "-jar", "/path/to/checkstyle.jar", "-f", "json"]
+        self.linter_cmd = ["java", *SHORT_LIVED_JVM_FLAGS, "-jar", "/path/to/checkstyle.jar", "-f", "json"]
 
         # Set server-specific configuration
         self._server_settings = {
@@ -72,6 +78,8 @@ class JavaLanguageServerManager(BaseLanguageServerManager):
                 }
             }
         }
+        # The settings don't change, so they are serialized once
+        self._server_settings_payload = json_dumps({"settings": self._server_settings})
 
     def start(self) -> None:
         """Start the Java language server process."""
@@ -81,7 +89,7 @@ class JavaLanguageServerManager(BaseLanguageServerManager):
 
         try:
             # Start the language server in a subprocess
-            self.logger.info(f"Starting Java language server with command: {' '.join(self.server_command)}")
+            self.logger.info("Starting Java language server with command: %s", self.server_command)
             self.server_process = subprocess.Popen(
                 self.server_command,
                 cwd=self.workspace_path,
@@ -129,90 +137,40 @@ class JavaLanguageServerManager(BaseLanguageServerManager):
     def _configure_server(self) -> None:
         """Configure the Java language server."""
         # Send didChangeConfiguration notification with our settings
-        self._send_notification("workspace/didChangeConfiguration", {
-            "settings": self._server_settings
-        })
+        self._send_notification_raw("workspace/didChangeConfiguration", self._server_settings_payload)
 
-    def run_linter(self, file_path: str) -> Dict[str, Any]:
-        """Run Checkstyle on the specified file using LSP.
+    def _fallback_lint_cmd(self, file_path: str) -> List[str]:
+        """Get the Checkstyle command for a file.
 
         Args:
             file_path: Path to the file to lint.
 
         Returns:
-            Dictionary containing linting results.
+            The command line.
         """
-        if not os.path.isfile(file_path):
-            raise ValueError(f"File not found: {file_path}")
-
-        self.logger.info(f"Running linter on file: {file_path}")
-
-        # Ensure the server is running
-        if not self.is_running():
-            self.start()
-
-        # Two approaches are possible:
-        # 1. Use the LSP server's built-in linting capabilities
-        # 2. Run checkstyle directly as before
-
-        # Approach 1: Use LSP diagnostics
-        # We need to open the document in the LSP server to trigger diagnostics
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        # Send didOpen notification
-        document_uri = self._path_to_uri(file_path)
-        self._send_notification("textDocument/didOpen", {
-            "textDocument": {
-                "uri": document_uri,
-                "languageId": "java",
-                "version": 1,
-                "text": content
-            }
-        })
+        return self.linter_cmd + [file_path]
 
-        # Eclipse JDT LS doesn't have a standard way to request diagnostics directly
-        # For now, we'll fall back to the direct checkstyle approach
+    def _fallback_format_cmd(self, file_path: str) -> List[str]:
+        """Get the google-java-format command for a file.
 
-        # Approach 2: Run checkstyle directly
-        cmd = self.linter_cmd + [file_path]
+        Args:
+            file_path: Path to the file to format.
 
-        try:
-            process = subprocess.run(
-                cmd,
-                cwd=self.workspace_path,
-                capture_output=True,
-                text=True,
-                check=False  # Don't raise exception on non-zero exit code
-            )
+        Returns:
+            The command line.
+        """
+        return self.formatter_cmd + [file_path]
 
-            # Parse JSON output
-            try:
-                if process.stdout.strip():
-                    results = json.loads(process.stdout)
-                else:
-                    results = []
-
-                return {
-                    "issues": results,
-                    "success": True
-                }
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Error parsing checkstyle output: {e}")
-                return {
-                    "issues": [],
-                    "success": False,
-                    "error": f"Error parsing linter output: {str(e)}",
-                    "raw_output": process.stdout
-                }
+    def run_linter(self, file_path: str) -> Dict[str, Any]:
+        """Run Checkstyle on the specified file using LSP.
 
-        except Exception as e:
-            self.logger.error(f"Error running checkstyle: {e}")
-            return {
-                "issues": [],
-                "success": False,
-                "error": str(e)
-            }
+        Args:
+            file_path: Path to the file to lint.
+
+        Returns:
+            Dictionary containing linting results.
+        """
+        return self._run_lsp_lint(file_path)
 
     def run_formatter(self, file_path: str) -> str:
         """Run Google Java Format on the specified file using LSP.
@@ -223,101 +181,4 @@ class JavaLanguageServerManager(BaseLanguageServerManager):
         Returns:
             Formatted content of the file.
         """
-        if not os.path.isfile(file_path):
-            raise ValueError(f"File not found: {file_path}")
-
-        self.logger.info(f"Formatting file: {file_path}")
-
-        # Ensure the server is running
-        if not self.is_running():
-            self.start()
-
-        # Read the file content
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        # Two approaches are possible:
-        # 1. Use the LSP server's formatting capabilities
-        # 2. Run google-java-format directly as before
-
-        # Approach 1: Use LSP formatting
-        # First, open the document in the LSP server
-        document_uri = self._path_to_uri(file_path)
-        self._send_notification("textDocument/didOpen", {
-            "textDocument": {
-                "uri": document_uri,
-                "languageId": "java",
-                "version": 1,
-                "text": content
-            }
-        })
-
-        # Request formatting
-        try:
-            response = self._send_request_sync("textDocument/formatting", {
-                "textDocument": {
-                    "uri": document_uri
-                },
-                "options": {
-                    "tabSize": 2,
-                    "insertSpaces": True
-                }
-            })
-
-            if response and "result" in response:
-                result = response["result"]
-                if result:
-                    # Apply text edits
-                    new_content = content
-                    # Sort edits in reverse order to avoid invalidating offsets
-                    for edit in sorted(result, key=lambda e: -1 * e["range"]["start"]["line"]):
-                        range_start = edit["range"]["start"]
-                        range_end = edit["range"]["end"]
-                        new_text = edit["newText"]
-
-                        # Convert to line and character offsets
-                        lines = new_content.splitlines(True)  # Keep line endings
-
-                        # Calculate character offsets
-                        start_offset = sum(len(lines[i]) for i in range(range_start["line"])) + range_start["character"]
-                        end_offset = sum(len(lines[i]) for i in range(range_end["line"])) + range_end["character"]
-
-                        # Apply the edit
-                        new_content = new_content[:start_offset] + new_text + new_content[end_offset:]
-
-                    # Close the document
-                    self._send_notification("textDocument/didClose", {
-                        "textDocument": {
-                            "uri": document_uri
-                        }
-                    })
-
-                    return new_content
-
-            # If we get here, either there were no edits or something went wrong
-            self.logger.info("No formatting changes from LSP server, falling back to direct Java formatter")
-
-        except Exception as e:
-            self.logger.error(f"Error during LSP formatting: {e}, falling back to direct Java formatter")
-
-        # Approach 2: Run google-java-format directly
-        try:
-            process = subprocess.run(
-                self.formatter_cmd + [file_path],
-                cwd=self.workspace_path,
-                capture_output=True,
-                text=True,
-                check=False  # Don't raise exception on non-zero exit code
-            )
-
-            if process.returncode == 0:
-                return process.stdout
-
-            self.logger.error(f"Java formatter error: {process.stderr}")
-            # If formatting fails, read and return original content
-            return content
-
-        except Exception as e:
-            self.logger.error(f"Error running Java formatter: {e}")
-            # If formatting fails, read and return original content
-            return content
+        return self._run_lsp_format(file_path)
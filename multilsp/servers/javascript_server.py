@@ -1,16 +1,28 @@
 """JavaScript language server manager implementation."""
 
-import json
 import os
+import shutil
 import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from multilsp.servers.base import BaseLanguageServerManager
+from multilsp.servers.base import BaseLanguageServerManager, DirectToolsMixin
+from multilsp.utils.serialization import json_dumps
 
+# Map file extensions to LSP language identifiers
+LANGUAGE_ID_MAP = {
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".jsx": "javascriptreact",
+    ".tsx": "typescriptreact"
+}
 
-class JavaScriptLanguageServerManager(BaseLanguageServerManager):
+
+class JavaScriptLanguageServerManager(DirectToolsMixin, BaseLanguageServerManager):
     """Manages the JavaScript/TypeScript language server."""
 
+    _LINTER_NAME = "eslint"
+    _FORMATTER_NAME = "prettier formatter"
+
     @property
     def language(self) -> str:
         """Get the language managed by this server.
@@ -38,8 +50,16 @@ class JavaScriptLanguageServerManager(BaseLanguageServerManager):
         super().__init__(workspace_path)
         self.server_process = None
         self.server_command = ["typescript-language-server", "--stdio"]
-        self.eslint_cmd = ["npx", "eslint", "--format=json"]
-        self.prettier_cmd = ["npx", "prettier", "--stdin-filepath"]
+        # Prefer the eslint_d/prettierd daemons, which keep a warm Node process
+        # between calls instead of paying npx resolution and Node startup
+        if shutil.which("eslint_d"):
+            self.eslint_cmd = ["eslint_d", "--format=json"]
+        else:
+            self.eslint_cmd = ["npx", "eslint", "--format=json"]
+        if shutil.which("prettierd"):
+            self.prettier_cmd = ["prettierd"]
+        else:
+            self.prettier_cmd = ["npx", "prettier", "--stdin-filepath"]
 
         # Set server-specific configuration
         self._server_settings = {
@@ -57,6 +77,8 @@ class JavaScriptLanguageServerManager(BaseLanguageServerManager):
                 }
             }
         }
+        # The settings don't change, so they are serialized once
+        self._server_settings_payload = json_dumps({"settings": self._server_settings})
 
     def start(self) -> None:
         """Start the JavaScript language server process."""
@@ -66,7 +88,7 @@ class JavaScriptLanguageServerManager(BaseLanguageServerManager):
 
         try:
             # Start the language server in a subprocess
-            self.logger.info(f"Starting JavaScript language server with command: {' '.join(self.server_command)}")
+            self.logger.info("Starting JavaScript language server with command: %s", self.server_command)
             self.server_process = subprocess.Popen(
                 self.server_command,
                 cwd=self.workspace_path,
@@ -114,100 +136,52 @@ class JavaScriptLanguageServerManager(BaseLanguageServerManager):
     def _configure_server(self) -> None:
         """Configure the JavaScript language server."""
         # Send didChangeConfiguration notification with our settings
-        self._send_notification("workspace/didChangeConfiguration", {
-            "settings": self._server_settings
-        })
+        self._send_notification_raw("workspace/didChangeConfiguration", self._server_settings_payload)
 
-    def run_linter(self, file_path: str) -> Dict[str, Any]:
-        """Run ESLint on the specified file using LSP.
+    def _language_id(self, file_path: str) -> str:
+        """Get the LSP language identifier of a file from its extension.
 
         Args:
-            file_path: Path to the file to lint.
+            file_path: Path to the file.
 
         Returns:
-            Dictionary containing linting results.
+            The language identifier.
         """
-        if not os.path.isfile(file_path):
-            raise ValueError(f"File not found: {file_path}")
-
-        self.logger.info(f"Running linter on file: {file_path}")
+        ext = os.path.splitext(file_path)[1].lower()
+        return LANGUAGE_ID_MAP.get(ext, "javascript")
 
-        # Ensure the server is running
-        if not self.is_running():
-            self.start()
+    def _fallback_lint_cmd(self, file_path: str) -> List[str]:
+        """Get the ESLint command for a file.
 
-        # Two approaches are possible:
-        # 1. Use the LSP server's built-in linting capabilities
-        # 2. Run eslint directly as before
+        Args:
+            file_path: Path to the file to lint.
 
-        # Approach 1: Use LSP diagnostics
-        # We need to open the document in the LSP server to trigger diagnostics
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+        Returns:
+            The command line.
+        """
+        return self.eslint_cmd + [file_path]
 
-        # Determine language ID based on file extension
-        ext = os.path.splitext(file_path)[1].lower()
-        language_id_map = {
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".jsx": "javascriptreact",
-            ".tsx": "typescriptreact"
-        }
-        language_id = language_id_map.get(ext, "javascript")
-
-        # Send didOpen notification
-        document_uri = self._path_to_uri(file_path)
-        self._send_notification("textDocument/didOpen", {
-            "textDocument": {
-                "uri": document_uri,
-                "languageId": language_id,
-                "version": 1,
-                "text": content
-            }
-        })
+    def _fallback_format_cmd(self, file_path: str) -> List[str]:
+        """Get the Prettier command for a file.
 
-        # TypeScript LSP doesn't have a standard way to request diagnostics directly
-        # For now, we'll fall back to the direct eslint approach
+        Args:
+            file_path: Path to the file to format.
 
-        # Approach 2: Run eslint directly
-        cmd = self.eslint_cmd + [file_path]
+        Returns:
+            The command line.
+        """
+        return self.prettier_cmd + [file_path]
 
-        try:
-            process = subprocess.run(
-                cmd,
-                cwd=self.workspace_path,
-                capture_output=True,
-                text=True,
-                check=False  # Don't raise exception on non-zero exit code
-            )
+    def run_linter(self, file_path: str) -> Dict[str, Any]:
+        """Run ESLint on the specified file using LSP.
 
-            # Parse JSON output
-            try:
-                if process.stdout.strip():
-                    results = json.loads(process.stdout)
-                else:
-                    results = []
-
-                return {
-                    "issues": results,
-                    "success": True
-                }
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Error parsing eslint output: {e}")
-                return {
-                    "issues": [],
-                    "success": False,
-                    "error": f"Error parsing linter output: {str(e)}",
-                    "raw_output": process.stdout
-                }
+        Args:
+            file_path: Path to the file to lint.
 
-        except Exception as e:
-            self.logger.error(f"Error running eslint: {e}")
-            return {
-                "issues": [],
-                "success": False,
-                "error": str(e)
-            }
+        Returns:
+            Dictionary containing linting results.
+        """
+        return self._run_lsp_lint(file_path)
 
     def run_formatter(self, file_path: str) -> str:
         """Run Prettier formatter on the specified file using LSP.
@@ -218,111 +192,4 @@ class JavaScriptLanguageServerManager(BaseLanguageServerManager):
         Returns:
             Formatted content of the file.
         """
-        if not os.path.isfile(file_path):
-            raise ValueError(f"File not found: {file_path}")
-
-        self.logger.info(f"Formatting file: {file_path}")
-
-        # Ensure the server is running
-        if not self.is_running():
-            self.start()
-
-        # Read the file content
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        # Two approaches are possible:
-        # 1. Use the LSP server's formatting capabilities
-        # 2. Run prettier directly as before
-
-        # Determine language ID based on file extension
-        ext = os.path.splitext(file_path)[1].lower()
-        language_id_map = {
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".jsx": "javascriptreact",
-            ".tsx": "typescriptreact"
-        }
-        language_id = language_id_map.get(ext, "javascript")
-
-        # Approach 1: Use LSP formatting
-        # First, open the document in the LSP server
-        document_uri = self._path_to_uri(file_path)
-        self._send_notification("textDocument/didOpen", {
-            "textDocument": {
-                "uri": document_uri,
-                "languageId": language_id,
-                "version": 1,
-                "text": content
-            }
-        })
-
-        # Request formatting
-        try:
-            response = self._send_request_sync("textDocument/formatting", {
-                "textDocument": {
-                    "uri": document_uri
-                },
-                "options": {
-                    "tabSize": 2,
-                    "insertSpaces": True
-                }
-            })
-
-            if response and "result" in response:
-                result = response["result"]
-                if result:
-                    # Apply text edits
-                    new_content = content
-                    # Sort edits in reverse order to avoid invalidating offsets
-                    for edit in sorted(result, key=lambda e: -1 * e["range"]["start"]["line"]):
-                        range_start = edit["range"]["start"]
-                        range_end = edit["range"]["end"]
-                        new_text = edit["newText"]
-
-                        # Convert to line and character offsets
-                        lines = new_content.splitlines(True)  # Keep line endings
-
-                        # Calculate character offsets
-                        start_offset = sum(len(lines[i]) for i in range(range_start["line"])) + range_start["character"]
-                        end_offset = sum(len(lines[i]) for i in range(range_end["line"])) + range_end["character"]
-
-                        # Apply the edit
-                        new_content = new_content[:start_offset] + new_text + new_content[end_offset:]
-
-                    # Close the document
-                    self._send_notification("textDocument/didClose", {
-                        "textDocument": {
-                            "uri": document_uri
-                        }
-                    })
-
-                    return new_content
-
-            # If we get here, either there were no edits or something went wrong
-            self.logger.info("No formatting changes from LSP server, falling back to direct prettier formatter")
-
-        except Exception as e:
-            self.logger.error(f"Error during LSP formatting: {e}, falling back to direct prettier formatter")
-
-        # Approach 2: Run prettier directly
-        try:
-            process = subprocess.run(
-                self.prettier_cmd + [file_path],
-                input=content,
-                capture_output=True,
-                text=True,
-                check=False  # Don't raise exception on non-zero exit code
-            )
-
-            if process.returncode == 0:
-                return process.stdout
-
-            self.logger.error(f"Prettier formatter error: {process.stderr}")
-            # Return original content if formatting fails
-            return content
-
-        except Exception as e:
-            self.logger.error(f"Error running prettier formatter: {e}")
-            # Return original content if formatting fails
-            return content
+        return self._run_lsp_format(file_path)
@@ -1,16 +1,43 @@
 """Python language server manager implementation."""
 
+import concurrent.futures
+import hashlib
 import json
 import os
+import shutil
 import subprocess
-from typing import Any, Dict, List
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from multilsp.servers.base import BaseLanguageServerManager
+from multilsp.utils.serialization import iter_json_array, json_dumps, json_loads
+from multilsp.utils.workspace import is_skipped_path
+
+# Window (in seconds) within which lint/format results for identical file
+# content are reused instead of running pylint or the formatter again
+RESULT_REUSE_WINDOW = 1.0
+
+# Number of recent lint/format results above which expired ones are dropped
+RESULT_CACHE_SIZE = 256
+
+# Number of formatted-content digests kept before the set is cleared
+FORMATTED_HASHES_SIZE = 4096
+
+# Script of the long-lived pylint worker process
+PYLINT_WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "workers", "pylint_worker.py"
+)
 
 
 class PythonLanguageServerManager(BaseLanguageServerManager):
     """Manages the Python language server."""
 
+    # Batches are linted by pylint alone
+    batch_lint_needs_server = False
+
     @property
     def language(self) -> str:
         """Get the language managed by this server.
@@ -50,7 +77,28 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
         self.server_process = None
         self.server_command = ["pylsp"]
         self.pylint_cmd = ["pylint", "--output-format=json"]
-        self.black_cmd = ["black", "-"]
+        # An absolute executable path lets subprocess use posix_spawn
+        self.black_cmd = [shutil.which("black") or "black", "-"]
+
+        # Long-lived pylint process serving lint requests over stdin/stdout;
+        # pylint_cmd is only run when the worker is busy or unavailable
+        self.pylint_worker_cmd = [sys.executable, PYLINT_WORKER_SCRIPT]
+        self._pylint_worker: Optional[subprocess.Popen] = None
+        self._pylint_worker_lock = threading.Lock()
+        self._next_pylint_request_id = 1
+        # Set once the worker died mid-request, so batches stop respawning it
+        self._pylint_worker_exited = False
+
+        # (operation, file_path, content digest) -> (time, result) of recent
+        # lint/format runs, and the futures of the runs in progress
+        self._recent_results: Dict[Tuple[str, str, bytes], Tuple[float, Any]] = {}
+        self._running_results: Dict[Tuple[str, str, bytes], concurrent.futures.Future] = {}
+        self._results_lock = threading.Lock()
+        # File path -> issues of its last successful lint, grouped by issue key
+        self._last_issues: Dict[str, Dict[Tuple[Any, ...], List[Dict[str, Any]]]] = {}
+        # Digests of content produced by a successful format; formatting is
+        # idempotent, so such content is returned without formatting it again
+        self._formatted_hashes: Set[bytes] = set()
 
         # Set server-specific configuration
         self._server_settings = {
@@ -72,6 +120,8 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
                 }
             }
         }
+        # The settings don't change, so they are serialized once
+        self._server_settings_payload = json_dumps({"settings": self._server_settings})
 
     def start(self) -> None:
         """Start the Python language server process."""
@@ -81,7 +131,7 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
 
         try:
             # Start the language server in a subprocess
-            self.logger.info(f"Starting Python language server with command: {' '.join(self.server_command)}")
+            self.logger.info("Starting Python language server with command: %s", self.server_command)
             self.server_process = subprocess.Popen(
                 self.server_command,
                 cwd=self.workspace_path,
@@ -97,6 +147,9 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
 
             # Configure the server
             self._configure_server()
+
+            # Let the pylint worker import pylint while the server warms up
+            self._start_pylint_worker()
         except Exception as e:
             self.logger.error(f"Failed to start Python language server: {e}")
             raise
@@ -106,6 +159,8 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
         # Stop LSP communication first
         self._stop_lsp_communication()
 
+        self._stop_pylint_worker()
+
         if self.server_process and self.server_process.poll() is None:
             self.logger.info("Stopping Python language server")
             try:
@@ -129,9 +184,7 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
     def _configure_server(self) -> None:
         """Configure the Python language server."""
         # Send didChangeConfiguration notification with our settings
-        self._send_notification("workspace/didChangeConfiguration", {
-            "settings": self._server_settings
-        })
+        self._send_notification_raw("workspace/didChangeConfiguration", self._server_settings_payload)
 
     def run_linter(self, file_path: str) -> Dict[str, Any]:
         """Run Pylint on the specified file using LSP.
@@ -142,10 +195,19 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
         Returns:
             Dictionary containing linting results.
         """
-        if not os.path.isfile(file_path):
-            raise ValueError(f"File not found: {file_path}")
+        # A single stat both validates the path and feeds the document cache
+        st = self._stat_regular_file(file_path)
 
-        self.logger.info(f"Running linter on file: {file_path}")
+        # Vendored and generated code isn't worth pylint's time
+        if is_skipped_path(file_path, self.workspace_path):
+            self.logger.info("Skipping linter on file: %s", file_path)
+            return {
+                "issues": [],
+                "success": True,
+                "skipped": True
+            }
+
+        self.logger.info("Running linter on file: %s", file_path)
 
         # Ensure the server is running
         if not self.is_running():
@@ -156,60 +218,330 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
         # 2. Run pylint directly as before
 
         # Approach 1: Use LSP diagnostics
-        # We need to open the document in the LSP server to trigger diagnostics
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        # Send didOpen notification
-        document_uri = self._path_to_uri(file_path)
-        self._send_notification("textDocument/didOpen", {
-            "textDocument": {
-                "uri": document_uri,
-                "languageId": "python",
-                "version": 1,
-                "text": content
-            }
-        })
+        # We need to open the document in the LSP server to trigger diagnostics;
+        # an unchanged document that is already open isn't sent again
+        content = self._sync_document(file_path, "python", st)
 
         # We could wait for diagnostics here, but the server doesn't have a standard way to request them
         # For now, we'll fall back to the direct pylint approach
 
         # Approach 2: Run pylint directly
-        cmd = self.pylint_cmd + [file_path]
-
         try:
-            process = subprocess.run(
-                cmd,
-                cwd=self.workspace_path,
-                capture_output=True,
-                text=True,
-                check=False  # Don't raise exception on non-zero exit code
+            return self._add_issue_changes(file_path, self._reuse_recent_result(
+                "lint", file_path, content, lambda: self._run_pylint([file_path])
+            ))
+        finally:
+            # Let a follow-up format reuse the open document
+            self._close_document_when_idle(file_path)
+
+    def run_linter_batch(self, file_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run Pylint on several files in a single process.
+
+        Pylint's startup cost is paid once for the whole batch, and the issues
+        are grouped back by file. The files are not opened in the LSP server,
+        which doesn't need to be running; the pylint worker is started if it
+        isn't. Vendored or generated files are reported as skipped.
+
+        Args:
+            file_paths: Paths to the files to lint.
+
+        Returns:
+            Dictionary mapping each file path to its linting results.
+        """
+        for file_path in file_paths:
+            self._stat_regular_file(file_path)
+
+        # Vendored and generated code isn't worth pylint's time
+        results: Dict[str, Dict[str, Any]] = {
+            file_path: {
+                "issues": [],
+                "success": True,
+                "skipped": True
+            }
+            for file_path in file_paths
+            if is_skipped_path(file_path, self.workspace_path)
+        }
+        file_paths = [file_path for file_path in file_paths if file_path not in results]
+        if not file_paths:
+            return results
+
+        self.logger.info("Running linter on %d files", len(file_paths))
+        if not self._pylint_worker_exited:
+            self._start_pylint_worker()
+        result = self._run_pylint(file_paths)
+        if not result["success"]:
+            results.update((file_path, result) for file_path in file_paths)
+            return results
+
+        # Pylint runs in the workspace and reports paths relative to it
+        def resolve(path: str) -> str:
+            return os.path.normpath(os.path.join(self.workspace_path, path))
+
+        path_by_resolved = {resolve(file_path): file_path for file_path in file_paths}
+        issues_by_path: Dict[str, List[Dict[str, Any]]] = {file_path: [] for file_path in file_paths}
+        for issue in result["issues"]:
+            file_path = path_by_resolved.get(resolve(issue.get("path", "")))
+            if file_path is not None:
+                issues_by_path[file_path].append(issue)
+
+        results.update(
+            (file_path, self._add_issue_changes(file_path, {
+                "issues": issues,
+                "success": True
+            }))
+            for file_path, issues in issues_by_path.items()
+        )
+        return results
+
+    def _add_issue_changes(self, file_path: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the changes since a file's previous lint to its lint result.
+
+        Issues are matched on (line, column, message-id, symbol, message),
+        counting repeats, so identical issues on one position are matched one
+        to one. The result gets "added" and "removed" issue lists and an
+        "unchanged_count", so callers can update only what changed instead of
+        every issue.
+
+        Args:
+            file_path: Path to the linted file.
+            result: Successful linting results for the file.
+
+        Returns:
+            A copy of the result with the changes, or the result itself if
+            linting failed.
+        """
+        if not result.get("success"):
+            return result
+
+        current: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+        for issue in result["issues"]:
+            key = (
+                issue.get("line"), issue.get("column"), issue.get("message-id"),
+                issue.get("symbol"), issue.get("message")
             )
+            current.setdefault(key, []).append(issue)
+        with self._results_lock:
+            previous = self._last_issues.get(file_path, {})
+            self._last_issues[file_path] = current
+
+        # The result may be shared with other callers, so it isn't modified
+        result = dict(result)
+        result["added"] = [
+            issue for key, issues in current.items() for issue in issues[len(previous.get(key, ())):]
+        ]
+        result["removed"] = [
+            issue for key, issues in previous.items() for issue in issues[len(current.get(key, ())):]
+        ]
+        result["unchanged_count"] = len(result["issues"]) - len(result["added"])
+        return result
+
+    def _content_digest(self, content: str) -> bytes:
+        """Get a digest identifying file content.
+
+        Args:
+            content: The content.
+
+        Returns:
+            The 16-byte BLAKE2b digest of the UTF-8 encoded content.
+        """
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+    def _remember_formatted(self, content: str) -> None:
+        """Record content produced by a successful format.
+
+        Args:
+            content: The formatted content.
+        """
+        if len(self._formatted_hashes) >= FORMATTED_HASHES_SIZE:
+            self._formatted_hashes.clear()
+        self._formatted_hashes.add(self._content_digest(content))
+
+    def _reuse_recent_result(self, operation: str, file_path: str, content: str, compute: Callable[[], Any]) -> Any:
+        """Run an operation on a file, or reuse the result for the same content.
+
+        A result computed within RESULT_REUSE_WINDOW for identical content is
+        returned as is, and a call made while the same operation is already
+        running on identical content waits for that run instead of starting
+        another one. This absorbs bursts of identical requests.
+
+        Args:
+            operation: Name of the operation, part of the cache key.
+            file_path: Path to the file.
+            content: Current content of the file.
+            compute: Function computing the result.
+
+        Returns:
+            The result of compute, possibly from an earlier or concurrent call.
+        """
+        key = (operation, file_path, self._content_digest(content))
+
+        with self._results_lock:
+            recent = self._recent_results.get(key)
+            if recent is not None and time.monotonic() - recent[0] < RESULT_REUSE_WINDOW:
+                return recent[1]
+
+            future = self._running_results.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._running_results[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._results_lock:
+                del self._running_results[key]
+
+        future.set_result(result)
+        with self._results_lock:
+            now = time.monotonic()
+            self._recent_results[key] = (now, result)
+
+            # Drop expired entries so the map doesn't grow without bound
+            if len(self._recent_results) > RESULT_CACHE_SIZE:
+                self._recent_results = {
+                    k: v for k, v in self._recent_results.items()
+                    if now - v[0] < RESULT_REUSE_WINDOW
+                }
+        return result
+
+    def _start_pylint_worker(self) -> None:
+        """Start the long-lived pylint worker, unless it is already running."""
+        with self._pylint_worker_lock:
+            if self._pylint_worker and self._pylint_worker.poll() is None:
+                return
+
+            try:
+                # The worker changes to the workspace itself, so that without
+                # cwd and close_fds subprocess can use posix_spawn
+                self._pylint_worker = subprocess.Popen(
+                    self.pylint_worker_cmd + [self.workspace_path],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False
+                )
+            except OSError as e:
+                self.logger.warning(f"Could not start pylint worker: {e}")
+                self._pylint_worker = None
+
+    def _stop_pylint_worker(self) -> None:
+        """Stop the pylint worker, if it is running."""
+        with self._pylint_worker_lock:
+            worker = self._pylint_worker
+            self._pylint_worker = None
+
+        if worker and worker.poll() is None:
+            try:
+                # The worker exits once its stdin is closed
+                worker.stdin.close()
+                worker.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                worker.kill()
+
+    def _run_pylint_worker(self, file_paths: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Lint files with the long-lived pylint worker.
+
+        Args:
+            file_paths: Paths to the files to lint.
+
+        Returns:
+            The pylint issues, or None if the worker is busy, not running or
+            failed, in which case pylint should be run directly.
+        """
+        # Concurrent lints run pylint directly rather than queue up
+        if not self._pylint_worker_lock.acquire(blocking=False):
+            return None
 
-            if process.returncode != 0 and process.returncode != 1:
-                # pylint returns 1 when it finds linting issues, which is expected
-                # Any other non-zero return code is an error
-                self.logger.error(f"Pylint error (code {process.returncode}): {process.stderr}")
+        try:
+            worker = self._pylint_worker
+            if worker is None or worker.poll() is not None:
+                return None
 
-            # Parse JSON output
+            request_id = self._next_pylint_request_id
+            self._next_pylint_request_id += 1
             try:
-                if process.stdout.strip():
-                    results = json.loads(process.stdout)
-                else:
-                    results = []
+                worker.stdin.write(json_dumps({"id": request_id, "paths": file_paths}) + b"\n")
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+            except OSError:
+                line = b""
+
+            if not line:
+                self.logger.warning("Pylint worker exited, running pylint directly from now on")
+                self._pylint_worker = None
+                self._pylint_worker_exited = True
+                return None
+        finally:
+            self._pylint_worker_lock.release()
+
+        response = json_loads(line)
+        if "error" in response:
+            self.logger.warning(f"Pylint worker error: {response['error']}, running pylint directly")
+            return None
+        return response["issues"]
+
+    def _run_pylint(self, file_paths: List[str]) -> Dict[str, Any]:
+        """Run Pylint on files, in the worker if possible or else directly.
+
+        Args:
+            file_paths: Paths to the files to lint.
+
+        Returns:
+            Dictionary containing linting results for all the files.
+        """
+        issues = self._run_pylint_worker(file_paths)
+        if issues is not None:
+            return {
+                "issues": issues,
+                "success": True
+            }
+
+        cmd = self.pylint_cmd + file_paths
+
+        try:
+            # Parse the JSON report as it is read (only a report under
+            # JSON_BUFFER_LIMIT is buffered in full, for a single orjson call);
+            # stderr goes to a temporary file so it can't fill a pipe while
+            # stdout is being read
+            with tempfile.TemporaryFile() as stderr, subprocess.Popen(
+                cmd,
+                cwd=self.workspace_path,
+                stdout=subprocess.PIPE,
+                stderr=stderr
+            ) as process:
+                try:
+                    results = list(iter_json_array(process.stdout))
+                except json.JSONDecodeError as e:
+                    # Don't wait for the rest of an output we can't parse
+                    process.kill()
+                    self.logger.error(f"Error parsing pylint output: {e}")
+                    return {
+                        "issues": [],
+                        "success": False,
+                        "error": f"Error parsing linter output: {str(e)}",
+                        "raw_output": e.doc
+                    }
+
+                process.wait()
+                if process.returncode != 0 and process.returncode != 1:
+                    # pylint returns 1 when it finds linting issues, which is expected
+                    # Any other non-zero return code is an error
+                    stderr.seek(0)
+                    self.logger.error(
+                        f"Pylint error (code {process.returncode}): {stderr.read().decode('utf-8', 'replace')}"
+                    )
 
                 return {
                     "issues": results,
                     "success": True
                 }
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Error parsing pylint output: {e}")
-                return {
-                    "issues": [],
-                    "success": False,
-                    "error": f"Error parsing linter output: {str(e)}",
-                    "raw_output": process.stdout
-                }
 
         except Exception as e:
             self.logger.error(f"Error running pylint: {e}")
@@ -228,34 +560,62 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
         Returns:
             Formatted content of the file.
         """
-        if not os.path.isfile(file_path):
-            raise ValueError(f"File not found: {file_path}")
+        # A single stat both validates the path and feeds the document cache
+        st = self._stat_regular_file(file_path)
 
-        self.logger.info(f"Formatting file: {file_path}")
+        self.logger.info("Formatting file: %s", file_path)
 
         # Ensure the server is running
         if not self.is_running():
             self.start()
 
-        # Read the file content
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
         # Two approaches are possible:
         # 1. Use the LSP server's formatting capabilities
         # 2. Run black directly as before
 
+        # First, build the notification that opens the document in the LSP
+        # server (this also reads the file content, from the cache if the file
+        # didn't change); it goes out in the same write as the formatting request
+        content, sync_message = self._document_sync_message(file_path, "python", st)
+        formatted = False
+
+        # Content that an earlier format produced is already formatted
+        if self._content_digest(content) in self._formatted_hashes:
+            if sync_message:
+                self._enqueue_message(sync_message)
+            self._close_document_when_idle(file_path)
+            return content
+
+        def format_content() -> str:
+            nonlocal formatted
+            formatted = True
+            return self._format_content(file_path, content, sync_message)
+
+        try:
+            return self._reuse_recent_result("format", file_path, content, format_content)
+        finally:
+            # A reused result sent no request, so the notification goes alone
+            if sync_message and not formatted:
+                self._enqueue_message(sync_message)
+            # Let a follow-up lint reuse the open document
+            self._close_document_when_idle(file_path)
+
+    def _format_content(
+        self, file_path: str, content: str, sync_message: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Format an open document with LSP formatting, or with black directly.
+
+        Args:
+            file_path: Path to the file to format.
+            content: Current content of the file.
+            sync_message: didOpen/didChange notification to send in the same
+                write as the formatting request, if the server's copy is stale.
+
+        Returns:
+            Formatted content of the file.
+        """
         # Approach 1: Use LSP formatting
-        # First, open the document in the LSP server
         document_uri = self._path_to_uri(file_path)
-        self._send_notification("textDocument/didOpen", {
-            "textDocument": {
-                "uri": document_uri,
-                "languageId": "python",
-                "version": 1,
-                "text": content
-            }
-        })
 
         # Request formatting
         try:
@@ -267,58 +627,43 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
                     "tabSize": 4,
                     "insertSpaces": True
                 }
-            })
-
-            if response and "result" in response:
-                result = response["result"]
-                if result:
-                    # Apply text edits
-                    new_content = content
-                    # Sort edits in reverse order to avoid invalidating offsets
-                    for edit in sorted(result, key=lambda e: -1 * e["range"]["start"]["line"]):
-                        range_start = edit["range"]["start"]
-                        range_end = edit["range"]["end"]
-                        new_text = edit["newText"]
+            }, preceding=[sync_message] if sync_message else None)
 
-                        # Convert to line and character offsets
-                        lines = new_content.splitlines(True)  # Keep line endings
+            # A null result means the server has no formatter for this file
+            # (pylsp without a formatter plugin), unlike an empty edit list,
+            # which means there is nothing to change
+            result = response.get("result") if response else None
+            if result is not None:
+                # Apply text edits
+                formatted_content = self._apply_text_edits(content, result) if result else content
+                self._remember_formatted(formatted_content)
+                return formatted_content
 
-                        # Calculate character offsets
-                        start_offset = sum(len(lines[i]) for i in range(range_start["line"])) + range_start["character"]
-                        end_offset = sum(len(lines[i]) for i in range(range_end["line"])) + range_end["character"]
-
-                        # Apply the edit
-                        new_content = new_content[:start_offset] + new_text + new_content[end_offset:]
-
-                    # Close the document
-                    self._send_notification("textDocument/didClose", {
-                        "textDocument": {
-                            "uri": document_uri
-                        }
-                    })
-
-                    return new_content
-
-            # If we get here, either there were no edits or something went wrong
-            self.logger.info("No formatting changes from LSP server, falling back to direct black formatter")
+            # If we get here, the request failed, timed out or wasn't handled
+            self.logger.info("LSP formatting failed, falling back to direct black formatter")
 
         except Exception as e:
             self.logger.error(f"Error during LSP formatting: {e}, falling back to direct black formatter")
 
-        # Approach 2: Run black directly
+        # Approach 2: Run black directly. Black reads and writes UTF-8, so bytes
+        # are exchanged instead of going through the locale's text encoding
         try:
             process = subprocess.run(
                 self.black_cmd,
-                input=content,
+                input=content.encode("utf-8"),
                 capture_output=True,
-                text=True,
+                # Our descriptors are non-inheritable anyway (PEP 446), and
+                # keeping close_fds off lets subprocess use posix_spawn
+                close_fds=False,
                 check=False  # Don't raise exception on non-zero exit code
             )
 
             if process.returncode == 0:
-                return process.stdout
+                formatted_content = process.stdout.decode("utf-8")
+                self._remember_formatted(formatted_content)
+                return formatted_content
 
-            self.logger.error(f"Black formatter error: {process.stderr}")
+            self.logger.error(f"Black formatter error: {process.stderr.decode('utf-8', 'replace')}")
             # Return original content if formatting fails
             return content
 
@@ -326,72 +671,3 @@ class PythonLanguageServerManager(BaseLanguageServerManager):
             self.logger.error(f"Error running black formatter: {e}")
             # Return original content if formatting fails
             return content
-
-    def get_definition(self, file_path: str, line: int, character: int) -> Dict[str, Any]:
-        """Get definition for the symbol at the specified position using Jedi.
-
-        Args:
-            file_path: Path to the file.
-            line: Line number (0-indexed).
-            character: Character position (0-indexed).
-
-        Returns:
-            Dictionary containing definition information.
-        """
-        self.logger.info(f"Getting definition in file: {file_path} at position {line}:{character}")
-
-        # Ensure the language server is running
-        if not self.is_running():
-            self.start()
-
-        # Prepare LSP request parameters
-        params = {
-            "textDocument": {
-                "uri": f"file://{os.path.abspath(file_path)}"
-            },
-            "position": {
-                "line": line,
-                "character": character
-            }
-        }
-
-        # Send request to language server
-        response = self._send_lsp_request("textDocument/definition", params)
-
-        return response.get("result", {})
-
-    def get_references(self, file_path: str, line: int, character: int) -> List[Dict[str, Any]]:
-        """Get references for the symbol at the specified position.
-
-        Args:
-            file_path: Path to the file.
-            line: Line number (0-indexed).
-            character: Character position (0-indexed).
-
-        Returns:
-            List of dictionaries containing reference information.
-        """
-        self.logger.info(f"Getting references in file: {file_path} at position {line}:{character}")
-
-        # Ensure the language server is running
-        if not self.is_running():
-            self.start()
-
-        # Prepare LSP request parameters
-        params = {
-            "textDocument": {
-                "uri": f"file://{os.path.abspath(file_path)}"
-            },
-            "position": {
-                "line": line,
-                "character": character
-            },
-            "context": {
-                "includeDeclaration": True
-            }
-        }
-
-        # Send request to language server
-        response = self._send_lsp_request("textDocument/references", params)
-
-        return response.get("result", [])
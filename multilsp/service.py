@@ -5,9 +5,13 @@ This module provides the primary service that manages multiple language servers
 and routes client requests to the appropriate server based on file type.
 """
 
+import concurrent.futures
 import logging
 import os
-from typing import Any, Dict, List, Optional, TypeAlias
+import signal
+import threading
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Set, TypeAlias
 
 import click
 
@@ -39,42 +43,119 @@ class MultiLanguageServer:
             # "java": JavaLanguageServerManager(self.workspace_path),
         }
 
-        self.logger.info(f"Initialized MultiLanguageServer for workspace: {self.workspace_path}")
+        # Map file extensions to the language servers that are configured,
+        # using the workspace's extension table as the single source
+        self._ext_to_server: Dict[str, LanguageServerManagerType] = {
+            ext: self.server_managers[lang]
+            for ext, lang in self.workspace.extension_to_language.items()
+            if lang in self.server_managers
+        }
+
+        # Language servers are started on first use
+        self._started_servers: Set[LanguageServerManagerType] = set()
+        self._started_lock = threading.Lock()
+        self._start_locks: Dict[LanguageServerManagerType, threading.Lock] = {
+            manager: threading.Lock() for manager in self.server_managers.values()
+        }
+
+        self.logger.info("Initialized MultiLanguageServer for workspace: %s", self.workspace_path)
 
     def start(self) -> None:
-        """Start all language servers."""
-        for lang, manager in self.server_managers.items():
-            self.logger.info(f"Starting {lang} language server...")
-            manager.start()
+        """Start the service.
+
+        Language servers are started lazily, the first time a file of their
+        language is requested, so a session that only touches some languages
+        doesn't pay for the other servers' processes.
+        """
+        self.logger.info("Language servers will be started on first use")
 
     def stop(self) -> None:
-        """Stop all language servers."""
-        for lang, manager in self.server_managers.items():
-            self.logger.info(f"Stopping {lang} language server...")
-            manager.stop()
+        """Stop all language servers and their helper processes.
+
+        Every manager is stopped, concurrently, since batch linting can start
+        helper processes (like the pylint worker) without the server itself;
+        stopping a manager that never started does nothing.
+
+        Raises:
+            Exception: The first error raised while stopping a server, after
+                all servers finished stopping.
+        """
+        managers = list(self.server_managers.values())
+        for manager in managers:
+            if manager.is_running():
+                self.logger.info("Stopping %s language server...", manager.language)
+        self._run_on_servers(managers, lambda manager: manager.stop())
+
+        with self._started_lock:
+            self._started_servers.clear()
+
+    def _run_on_servers(
+        self,
+        managers: List[LanguageServerManagerType],
+        action: Callable[[LanguageServerManagerType], None]
+    ) -> None:
+        """Run an action on language server managers concurrently.
+
+        Args:
+            managers: The managers to run the action with.
+            action: The action to run with each manager.
+
+        Raises:
+            Exception: The first error raised by the action, once it completed
+                for every manager.
+        """
+        if not managers:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(managers)) as executor:
+            futures = [executor.submit(action, manager) for manager in managers]
+        for future in futures:
+            future.result()
+
+    def _ensure_started(self, manager: LanguageServerManagerType) -> None:
+        """Start a language server on its first use.
+
+        Each server has its own lock, so servers of different languages that
+        are first used at the same time start concurrently.
+
+        Args:
+            manager: The language server manager.
+        """
+        with self._start_locks[manager]:
+            if manager in self._started_servers:
+                return
+            if not manager.is_running():
+                self.logger.info("Starting %s language server...", manager.language)
+                manager.start()
+            with self._started_lock:
+                self._started_servers.add(manager)
+
+    def _server_for_extension(self, file_path: str) -> Optional[LanguageServerManagerType]:
+        """Get the language server configured for a file's extension, without starting it.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            The language server manager, or None if no server supports this file.
+        """
+        return self._ext_to_server.get(os.path.splitext(file_path)[1].lower())
 
     def get_server_for_file(self, file_path: str) -> Optional[LanguageServerManagerType]:
         """Get the appropriate language server for a given file.
 
+        The server is started if this is its first use.
+
         Args:
             file_path: Path to the file to analyze.
 
         Returns:
             The appropriate language server manager or None if no server supports this file.
         """
-        file_ext = os.path.splitext(file_path)[1].lower()
-
-        # Map file extensions to language servers
-        ext_to_server = {
-            ".py": self.server_managers["python"],
-            ".js": self.server_managers["javascript"],
-            ".ts": self.server_managers["javascript"],
-            ".jsx": self.server_managers["javascript"],
-            ".tsx": self.server_managers["javascript"],
-            ".java": self.server_managers["java"],
-        }
-
-        return ext_to_server.get(file_ext)
+        server = self._server_for_extension(file_path)
+        if server is not None and server not in self._started_servers:
+            self._ensure_started(server)
+        return server
 
     def run_linter(self, file_path: str) -> Dict[str, Any]:
         """Run linter on the specified file.
@@ -94,6 +175,48 @@ class MultiLanguageServer:
 
         return server.run_linter(file_path)
 
+    def run_linter_batch(self, file_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run linters on several files.
+
+        Files are grouped by language server; each server lints its group in
+        one batch, and the groups are linted concurrently. Servers that need
+        to be running for batch linting are started within their group's
+        task, so their startups overlap too.
+
+        Args:
+            file_paths: Paths to the files to lint.
+
+        Returns:
+            Dictionary mapping each file path to its linting results.
+
+        Raises:
+            ValueError: If no appropriate language server is found for a file.
+        """
+        files_by_server: Dict[LanguageServerManagerType, List[str]] = {}
+        for file_path in file_paths:
+            server = self._server_for_extension(file_path)
+            if not server:
+                raise ValueError(f"No language server found for file: {file_path}")
+            files_by_server.setdefault(server, []).append(file_path)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        if not files_by_server:
+            return results
+
+        def lint_group(server: LanguageServerManagerType, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+            if server.batch_lint_needs_server and server not in self._started_servers:
+                self._ensure_started(server)
+            return server.run_linter_batch(paths)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(files_by_server)) as executor:
+            futures = [
+                executor.submit(lint_group, server, paths)
+                for server, paths in files_by_server.items()
+            ]
+        for future in futures:
+            results.update(future.result())
+        return results
+
     def run_formatter(self, file_path: str) -> str:
         """Run formatter on the specified file.
 
@@ -172,15 +295,24 @@ def main(workspace: str, debug: bool) -> None:
 
     # Initialize and start the service
     service = MultiLanguageServer(workspace)
+    stop_event = threading.Event()
+
+    def _request_stop(_signum: int, _frame: Optional[FrameType]) -> None:
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _request_stop)
+
     try:
         service.start()
         click.echo(f"MultiLanguageServer started for workspace: {workspace}")
         # Keep the service running until Ctrl+C
         click.echo("Press Ctrl+C to stop the service")
-        import time
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+        if os.name == "nt":
+            # Lock waits aren't interrupted by signals on Windows
+            while not stop_event.wait(1):
+                pass
+        else:
+            stop_event.wait()
         click.echo("Stopping service...")
     finally:
         service.stop()
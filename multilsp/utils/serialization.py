@@ -0,0 +1,154 @@
+"""JSON serialization helpers for the Multi-Language LSP Interface.
+
+orjson is used when it is installed, falling back to the standard library json
+module otherwise. Both functions work with bytes, which is what the LSP
+transport and subprocess pipes deal in.
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Largest report that iter_json_array parses in one orjson call; larger ones
+# are decoded incrementally so memory stays bounded
+JSON_BUFFER_LIMIT = 8 << 20
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_DELIMITERS = _JSON_WHITESPACE + ",]"
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON document as bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: The JSON document, as bytes or str.
+
+    Returns:
+        The deserialized object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def iter_json_array(
+    stream: BinaryIO, chunk_size: int = 65536, buffer_limit: int = JSON_BUFFER_LIMIT
+) -> Iterator[Any]:
+    """Incrementally decode the elements of a JSON array read from a stream.
+
+    Elements are decoded as the input arrives, so only one chunk of input
+    plus the element being decoded is held in memory. With orjson, a stream
+    of at most buffer_limit bytes is instead parsed in a single call, which is
+    about twice as fast; only a longer stream is decoded incrementally, after
+    its first buffer_limit bytes. An empty stream yields nothing.
+
+    Args:
+        stream: Binary stream containing a single top-level JSON array.
+        chunk_size: Number of bytes to read at a time.
+        buffer_limit: Largest stream parsed in one call when orjson is available.
+
+    Yields:
+        The elements of the array, in order.
+
+    Raises:
+        json.JSONDecodeError: If the stream is not a valid JSON array.
+    """
+    prefix = b""
+    if orjson is not None:
+        prefix = stream.read(buffer_limit + 1)
+        if len(prefix) <= buffer_limit:
+            if not prefix.strip():
+                return
+            value = orjson.loads(prefix)
+            if not isinstance(value, list):
+                raise json.JSONDecodeError("Expected a JSON array", prefix.decode("utf-8", "replace"), 0)
+            yield from value
+            return
+
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = utf8.decode(prefix)
+    pos = 0
+    eof = False
+    started = False
+    expect_value = True
+    allow_close = True
+
+    while True:
+        # Skip whitespace, refilling the buffer as needed
+        while pos < len(buf) and buf[pos] in _JSON_WHITESPACE:
+            pos += 1
+        if pos == len(buf):
+            if eof:
+                if started:
+                    raise json.JSONDecodeError("Unterminated JSON array", buf, pos)
+                return
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + utf8.decode(chunk, final=eof)
+            pos = 0
+            continue
+
+        char = buf[pos]
+        if not started:
+            if char != "[":
+                raise json.JSONDecodeError("Expected a JSON array", buf, pos)
+            started = True
+            pos += 1
+        elif char == "]" and allow_close:
+            return
+        elif char == "," and not expect_value:
+            expect_value = True
+            allow_close = False
+            pos += 1
+        elif expect_value:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+
+            # A value that runs to the end of the buffer, or a number followed by
+            # something other than a delimiter, may have been split across
+            # chunks, so read more first
+            truncated = end is None or (not eof and (
+                end == len(buf) or buf[end] not in _JSON_DELIMITERS
+            ))
+            if truncated:
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + utf8.decode(chunk, final=eof)
+                pos = 0
+                continue
+
+            yield value
+            pos = end
+            expect_value = False
+            allow_close = True
+        else:
+            raise json.JSONDecodeError("Expected ',' or ']'", buf, pos)
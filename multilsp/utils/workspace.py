@@ -1,8 +1,52 @@
 """Workspace management utilities for the Multi-Language LSP Interface."""
 
+import concurrent.futures
+import gzip
+import hashlib
 import logging
 import os
-from typing import Dict, List, Optional, Set
+import pickle
+import re
+import tempfile
+from typing import Dict, List, Optional, Set, Tuple
+
+# Maximum number of threads listing directories during a workspace scan
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Where workspace indexes are persisted between runs
+INDEX_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "multilsp"
+)
+
+# Bumped when the persisted index format or the scan rules change
+INDEX_CACHE_VERSION = 2
+
+# Directories that the workspace scan doesn't descend into: VCS metadata,
+# environments, dependencies, caches and build output
+PRUNED_DIRECTORIES = frozenset({".git", ".venv", "node_modules", "__pycache__", "build", "dist", ".tox"})
+
+# Vendored, cached and generated files, which are neither indexed nor linted
+SKIPPED_PATH_PATTERN = re.compile(r"/(?:\.venv|node_modules|__pycache__)/|_pb2\.py$")
+
+
+def is_skipped_path(file_path: str, workspace_path: str) -> bool:
+    """Check whether a file is vendored, cached or generated.
+
+    Only the part of the path inside the workspace is matched, so a workspace
+    that itself lives under e.g. a node_modules directory isn't skipped whole.
+
+    Args:
+        file_path: Path to the file.
+        workspace_path: Absolute path of the workspace directory.
+
+    Returns:
+        True if the file matches SKIPPED_PATH_PATTERN.
+    """
+    path = os.path.abspath(file_path)
+    if path.startswith(workspace_path + os.sep):
+        # Keep the leading separator, which the directory patterns expect
+        path = path[len(workspace_path):]
+    return SKIPPED_PATH_PATTERN.search(path.replace(os.sep, "/")) is not None
 
 
 class WorkspaceManager:
@@ -20,7 +64,7 @@ class WorkspaceManager:
         if not os.path.isdir(self.workspace_path):
             raise ValueError(f"Workspace path is not a directory: {self.workspace_path}")
 
-        self.logger.info(f"Initialized workspace manager for: {self.workspace_path}")
+        self.logger.info("Initialized workspace manager for: %s", self.workspace_path)
 
         # Track files by language
         self.files_by_language: Dict[str, Set[str]] = {
@@ -28,6 +72,13 @@ class WorkspaceManager:
             "javascript": set(),
             "java": set(),
         }
+        # Language -> snapshot of its files, rebuilt after the set changes
+        self._files_snapshot: Dict[str, Tuple[str, ...]] = {}
+        # Scanned directory -> its modification time, to validate the persisted index
+        self._directory_mtimes: Dict[str, int] = {}
+        self._index_cache_path = os.path.join(
+            INDEX_CACHE_DIR, hashlib.sha1(self.workspace_path.encode()).hexdigest() + ".pkl"
+        )
 
         # Map file extensions to languages
         self.extension_to_language = {
@@ -38,44 +89,189 @@ class WorkspaceManager:
             ".tsx": "javascript",
             ".java": "java",
         }
+        # Extensions grouped per language, so a file name is matched with one
+        # str.endswith call per language instead of os.path.splitext
+        extensions: Dict[str, Tuple[str, ...]] = {}
+        for ext, lang in self.extension_to_language.items():
+            extensions[lang] = extensions.get(lang, ()) + (ext,)
+        self._extensions_by_language = list(extensions.items())
+
+        # Reuse the persisted index if the workspace is unchanged, otherwise
+        # scan it to discover files
+        if not self._load_index():
+            self._scan_workspace()
+            self._save_index()
+
+    def _load_index(self) -> bool:
+        """Load the persisted index of the workspace if it is still valid.
+
+        Files are only added or removed by changing a directory, which
+        updates its modification time, so the index is valid when every
+        scanned directory still has the modification time it had during the
+        scan. Stat-ing the directories is much cheaper than listing them.
+
+        Returns:
+            True if the index was loaded, False if the workspace must be scanned.
+        """
+        try:
+            with gzip.open(self._index_cache_path, "rb") as f:
+                index = pickle.load(f)
+            if index["version"] != INDEX_CACHE_VERSION or index["workspace_path"] != self.workspace_path:
+                return False
+            for directory, mtime in index["directories"].items():
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return False
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.debug("Ignoring unusable workspace index %s: %s", self._index_cache_path, e)
+            return False
+
+        self._directory_mtimes = index["directories"]
+        for language, files in index["files_by_language"].items():
+            if language in self.files_by_language:
+                self.files_by_language[language] = files
+        self.logger.info("Loaded workspace index from: %s", self._index_cache_path)
+        return True
+
+    def _save_index(self) -> None:
+        """Persist the index of the workspace for the next run.
 
-        # Scan workspace to discover files
-        self._scan_workspace()
+        The index is written to a temporary file that replaces the previous
+        one, so concurrent runs never read a partial index. Failures are
+        logged and otherwise ignored.
+        """
+        index = {
+            "version": INDEX_CACHE_VERSION,
+            "workspace_path": self.workspace_path,
+            "directories": self._directory_mtimes,
+            "files_by_language": self.files_by_language,
+        }
+        try:
+            os.makedirs(INDEX_CACHE_DIR, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=INDEX_CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1) as f:
+                    pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._index_cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            self.logger.warning("Failed to save workspace index to %s: %s", self._index_cache_path, e)
 
     def _scan_workspace(self) -> None:
         """Scan the workspace directory to discover files by language."""
-        self.logger.info(f"Scanning workspace: {self.workspace_path}")
+        self.logger.info("Scanning workspace: %s", self.workspace_path)
+
+        directory, mtime, subdirectories, files = self._scan_directory(self.workspace_path)
+        if mtime is not None:
+            self._directory_mtimes[directory] = mtime
+        subtrees = [files]
 
-        for root, _, files in os.walk(self.workspace_path):
-            for file in files:
-                file_path = os.path.join(root, file)
+        # Each top-level subtree is walked serially by one worker, which keeps
+        # the per-directory overhead as low as a plain walk while subtrees are
+        # listed concurrently; files are categorized on this thread, so the
+        # file sets need no locking
+        if subdirectories:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(SCAN_WORKERS, len(subdirectories)), thread_name_prefix="workspace-scan"
+            ) as executor:
+                for directory_mtimes, subtree_files in executor.map(self._scan_tree, subdirectories):
+                    self._directory_mtimes.update(directory_mtimes)
+                    subtrees.append(subtree_files)
+
+        for subtree_files in subtrees:
+            for file_path in subtree_files:
                 self._categorize_file(file_path)
 
+    def _scan_tree(self, top: str) -> Tuple[Dict[str, int], List[str]]:
+        """Walk a directory tree serially for the workspace scan.
+
+        Args:
+            top: Path to the root of the tree.
+
+        Returns:
+            Tuple of the modification times of the readable directories in the
+            tree and the paths of the files in it.
+        """
+        directory_mtimes: Dict[str, int] = {}
+        tree_files: List[str] = []
+        stack = [top]
+        while stack:
+            directory, mtime, subdirectories, files = self._scan_directory(stack.pop())
+            if mtime is not None:
+                directory_mtimes[directory] = mtime
+            tree_files.extend(files)
+            stack.extend(subdirectories)
+        return directory_mtimes, tree_files
+
+    def _scan_directory(self, directory: str) -> Tuple[str, Optional[int], List[str], List[str]]:
+        """List a directory for the workspace scan.
+
+        Entry types come from the directory listing itself, so no extra stat
+        is needed per entry. Like os.walk, symlinks to directories are not
+        followed and unreadable directories are skipped. Directories named in
+        PRUNED_DIRECTORIES are not returned, so they are never listed.
+
+        Args:
+            directory: Path to the directory to list.
+
+        Returns:
+            Tuple of the directory path, its modification time in nanoseconds
+            (None if it is unreadable), and the subdirectory paths and the file
+            paths in the directory.
+        """
+        mtime: Optional[int] = None
+        subdirectories = []
+        files = []
+        try:
+            # Taken before listing, so a change during the listing shows as stale
+            mtime = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name not in PRUNED_DIRECTORIES and not entry.is_symlink():
+                            subdirectories.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError as e:
+            self.logger.debug("Skipping unreadable directory %s: %s", directory, e)
+            mtime = None
+        return directory, mtime, subdirectories, files
+
     def _categorize_file(self, file_path: str) -> None:
         """Categorize a file by its language based on extension.
 
         Args:
             file_path: Path to the file to categorize.
         """
-        _, ext = os.path.splitext(file_path)
-        language = self.extension_to_language.get(ext.lower())
+        language = self.get_language_for_file(file_path)
 
-        if language and language in self.files_by_language:
+        if language and language in self.files_by_language and not is_skipped_path(file_path, self.workspace_path):
             self.files_by_language[language].add(file_path)
+            self._files_snapshot.pop(language, None)
 
-    def get_files_by_language(self, language: str) -> List[str]:
+    def get_files_by_language(self, language: str) -> Tuple[str, ...]:
         """Get all files for a specific language.
 
+        The result is an immutable snapshot that is reused until files of the
+        language are added or removed.
+
         Args:
             language: The language to get files for.
 
         Returns:
-            List of file paths for the specified language.
+            Tuple of file paths for the specified language.
         """
         if language not in self.files_by_language:
-            return []
+            return ()
 
-        return list(self.files_by_language[language])
+        snapshot = self._files_snapshot.get(language)
+        if snapshot is None:
+            snapshot = tuple(self.files_by_language[language])
+            self._files_snapshot[language] = snapshot
+        return snapshot
 
     def get_language_for_file(self, file_path: str) -> Optional[str]:
         """Get the language for a specific file.
@@ -86,8 +282,11 @@ class WorkspaceManager:
         Returns:
             The language for the file or None if not supported.
         """
-        _, ext = os.path.splitext(file_path)
-        return self.extension_to_language.get(ext.lower())
+        name = file_path.lower()
+        for language, exts in self._extensions_by_language:
+            if name.endswith(exts):
+                return language
+        return None
 
     def add_file(self, file_path: str) -> None:
         """Add a file to the workspace tracking.
@@ -103,8 +302,10 @@ class WorkspaceManager:
         Args:
             file_path: Path to the file to remove.
         """
-        for language in self.files_by_language:
-            self.files_by_language[language].discard(file_path)
+        for language, files in self.files_by_language.items():
+            if file_path in files:
+                files.discard(file_path)
+                self._files_snapshot.pop(language, None)
 
     def is_file_in_workspace(self, file_path: str) -> bool:
         """Check if a file is in the workspace.
@@ -0,0 +1 @@
+"""Long-lived helper processes used by the language server managers."""
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Long-lived pylint worker for the Python language server manager.
+
+Usage: pylint_worker.py [WORKSPACE]
+
+Changes to WORKSPACE, if given, so relative paths and pylint configuration
+resolve as for a pylint run there. Then reads one JSON request per line on
+stdin, {"id": ..., "paths": [...]}, lints the paths in this process and
+writes one JSON response per line on stdout, {"id": ..., "issues": [...]} or
+{"id": ..., "error": "..."}. Keeping the process alive pays the interpreter
+and pylint import startup only once.
+"""
+
+import io
+import json
+import os
+import sys
+
+
+def main() -> int:
+    """Serve lint requests until stdin is closed.
+
+    Returns:
+        Exit code.
+    """
+    if len(sys.argv) > 1:
+        os.chdir(sys.argv[1])
+
+    # The protocol owns stdout; anything pylint prints goes to stderr
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    from astroid import MANAGER
+    from pylint.lint import Run
+    from pylint.reporters.json_reporter import JSONReporter
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        request = json.loads(line)
+        response = {"id": request.get("id")}
+        try:
+            # Files may have changed since the previous request
+            MANAGER.clear_cache()
+
+            output = io.StringIO()
+            Run(list(request["paths"]), reporter=JSONReporter(output), exit=False)
+            response["issues"] = json.loads(output.getvalue() or "[]")
+        except (Exception, SystemExit) as e:
+            response["error"] = f"{type(e).__name__}: {e}"
+
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
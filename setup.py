@@ -47,6 +47,10 @@ setup(
         "pydantic>=2.0.0",
         "click>=8.1.0",
     ],
+    extras_require={
+        # Faster JSON for LSP traffic and linter reports
+        "fast": ["orjson>=3.8.0"],
+    },
     entry_points={
         "console_scripts": [
             "multilsp=multilsp.cli:main",